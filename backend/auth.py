@@ -2,21 +2,86 @@ from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
+import threading
+import time
 import os
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is slow by design, so async callers hash on a small dedicated pool
+# instead of the event loop or the threadpool shared with sync dependencies
+AUTH_HASH_WORKERS = int(os.environ.get("AUTH_HASH_WORKERS", "2"))
+hash_executor = ThreadPoolExecutor(max_workers=AUTH_HASH_WORKERS, thread_name_prefix="auth-hash")
+
 # JWT settings
 SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "your-secret-key-change-this")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Decoded claims are cached per token until it expires
+TOKEN_CACHE_MAX_ENTRIES = int(os.environ.get("TOKEN_CACHE_MAX_ENTRIES", "1024"))
+
 # HTTP Bearer for token extraction
 security = HTTPBearer()
 
+class TokenClaimsCache:
+    """Bounded LRU of verified JWT claims keyed by the raw token.
+
+    verify_token runs in FastAPI's threadpool, so access is guarded by a lock.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                claims, expires_at = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(token)
+                    self.hits += 1
+                    return claims
+                del self._entries[token]
+            self.misses += 1
+            return None
+
+    def set(self, token: str, claims: dict, expires_at: float):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[token] = (claims, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+token_cache = TokenClaimsCache()
+
 class AuthManager:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -28,6 +93,18 @@ class AuthManager:
         """Hash a password."""
         return pwd_context.hash(password)
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the hashing pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_executor, pwd_context.verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Hash a password on the hashing pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_executor, pwd_context.hash, password)
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: timedelta = None):
         """Create JWT access token."""
@@ -43,8 +120,13 @@ class AuthManager:
     @staticmethod
     def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
         """Verify JWT token."""
+        token = credentials.credentials
+        cached = token_cache.get(token)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             username: str = payload.get("sub")
             user_id: str = payload.get("user_id")
             role: str = payload.get("role")
@@ -54,12 +136,16 @@ class AuthManager:
                     detail="Could not validate credentials",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
-            return {
+            claims = {
                 "sub": username,
                 "user_id": user_id,
                 "role": role,
                 "exp": payload.get("exp")
             }
+            # Tokens without exp are still honoured but not cached
+            if claims["exp"] is not None:
+                token_cache.set(token, claims, claims["exp"])
+            return dict(claims)
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,113 @@
+"""
+In-process caches for G.M.B Travels Kashmir API
+Keeps hot public reads in memory so steady-state traffic skips MongoDB
+"""
+
+import os
+import time
+import asyncio
+import threading
+import logging
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """Namespaced key/value cache with a per-entry time-to-live.
+
+    Entries are grouped by namespace (usually a collection name) so that a
+    write to that collection can drop every cached query shape at once.
+    The TTL bounds staleness when several workers serve the same database.
+
+    Read-through callers capture generation() before their awaited read and
+    pass it to set(), so a result that raced an invalidation is not stored.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self, namespace: str) -> int:
+        """Counter that changes whenever the namespace (or the whole cache) is invalidated."""
+        with self._lock:
+            return self._global_generation + self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """Return a cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store a value under namespace/key.
+
+        When generation is given and the namespace has been invalidated since,
+        the value is stale and is dropped instead.
+        """
+        with self._lock:
+            if generation is not None and generation != self._global_generation + self._generations.get(namespace, 0):
+                return
+            if len(self._entries) >= self.max_entries:
+                self._evict_expired()
+            if len(self._entries) >= self.max_entries:
+                # Still full: drop the entry closest to expiry
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop every entry in a namespace, or the whole cache."""
+        with self._lock:
+            if namespace is None:
+                self._global_generation += 1
+                self._entries.clear()
+            else:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+                for cache_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[cache_key]
+        logger.debug(f"Cache invalidated: {namespace or 'all'}")
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for cache_key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[cache_key]
+
+class MemoryStore:
+    """Holds a single memory-resident value that is swapped atomically.
+
+    Writers take `lock` around their read-modify-write so concurrent admin
+    updates cannot interleave; readers just use `value`.
+    """
+
+    def __init__(self):
+        self.value: Optional[Any] = None
+        self.loaded_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    def set(self, value: Any) -> None:
+        """Replace the held value."""
+        self.value = value
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        """True when nothing is loaded, or the value is older than max_age_seconds (0 disables ageing)."""
+        if self.value is None:
+            return True
+        return max_age_seconds > 0 and time.monotonic() - self.loaded_at > max_age_seconds
+
+# Global instances
+catalog_cache = TTLCache(
+    ttl_seconds=float(os.environ.get("CATALOG_CACHE_TTL_SECONDS", "300")),
+    max_entries=int(os.environ.get("CATALOG_CACHE_MAX_ENTRIES", "256"))
+)
+site_settings_store = MemoryStore()
@@ -51,11 +51,13 @@ async def create_indexes():
         await db.packages.create_index([("title", 1)])
         await db.packages.create_index([("status", 1)])
         await db.packages.create_index([("createdAt", -1)])
+        await db.packages.create_index([("createdAt", -1), ("_id", -1)])
         
         # Create indexes for bookings
         await db.bookings.create_index([("email", 1)])
         await db.bookings.create_index([("status", 1)])
         await db.bookings.create_index([("createdAt", -1)])
+        await db.bookings.create_index([("createdAt", -1), ("_id", -1)])
         
         # Create indexes for testimonials
         await db.testimonials.create_index([("status", 1)])
@@ -65,6 +67,7 @@ async def create_indexes():
         await db.cab_bookings.create_index([("email", 1)])
         await db.cab_bookings.create_index([("status", 1)])
         await db.cab_bookings.create_index([("pickupDate", 1)])
+        await db.cab_bookings.create_index([("createdAt", -1)])
         
         # Create indexes for contact inquiries
         await db.contact_inquiries.create_index([("status", 1)])
@@ -83,12 +86,22 @@ async def create_indexes():
         await db.team_members.create_index([("role", 1)])
         await db.team_members.create_index([("isActive", 1)])
         await db.team_members.create_index([("createdAt", -1)])
+        await db.team_members.create_index([("createdAt", -1), ("_id", -1)])
         
         # Create indexes for popups
         await db.popups.create_index([("isActive", 1)])
         await db.popups.create_index([("startDate", 1)])
         await db.popups.create_index([("endDate", 1)])
         await db.popups.create_index([("createdAt", -1)])
+        await db.popups.create_index([("createdAt", -1), ("_id", -1)])
+        
+        # Create indexes for clients
+        await db.clients.create_index([("status", 1)])
+        await db.clients.create_index([("createdAt", -1), ("_id", -1)])
+        
+        # Create indexes for blog posts
+        await db.blog_posts.create_index([("status", 1)])
+        await db.blog_posts.create_index([("createdAt", -1), ("_id", -1)])
         
         # Create indexes for site settings
         await db.site_settings.create_index([("isActive", 1)])
@@ -106,6 +119,17 @@ async def create_indexes():
         await db.whatsapp_templates.create_index([("category", 1)])
         await db.whatsapp_templates.create_index([("isActive", 1)])
         
+        # Create indexes for PDF jobs
+        await db.pdf_jobs.create_index([("status", 1), ("createdAt", 1)])
+        
+        # Shared login throttle counters expire on their own
+        await db.login_throttle.create_index([("expiresAt", 1)], expireAfterSeconds=0)
+        
+        # Create indexes for refresh tokens (stored hashed, removed once expired)
+        await db.refresh_tokens.create_index([("expiresAt", 1)], expireAfterSeconds=0)
+        await db.refresh_tokens.create_index([("family", 1)])
+        await db.refresh_tokens.create_index([("userId", 1)])
+        
         logger.info("Database indexes created successfully")
         
     except Exception as e:
@@ -0,0 +1,94 @@
+"""
+Streaming data exports for G.M.B Travels Kashmir API
+Iterates Motor cursors in batches and yields NDJSON or CSV chunks for StreamingResponse
+"""
+
+import os
+import io
+import csv
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", "500"))
+
+# URL name -> (collection, CSV columns)
+EXPORT_DATASETS: Dict[str, Dict[str, Any]] = {
+    "bookings": {
+        "collection": "bookings",
+        "columns": [
+            "_id", "createdAt", "customerName", "email", "phone", "packageId", "packageTitle",
+            "travelDate", "travelers", "totalAmount", "status", "bookingType", "specialRequests"
+        ]
+    },
+    "cab-bookings": {
+        "collection": "cab_bookings",
+        "columns": [
+            "_id", "createdAt", "customerName", "email", "phone", "pickupLocation", "dropLocation",
+            "pickupDate", "pickupTime", "returnDate", "returnTime", "tripType", "vehicleType",
+            "passengers", "estimatedCost", "status", "specialRequests"
+        ]
+    },
+    "inquiries": {
+        "collection": "contact_inquiries",
+        "columns": [
+            "_id", "createdAt", "name", "email", "phone", "subject", "inquiryType",
+            "message", "preferredContact", "status"
+        ]
+    }
+}
+
+class ExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+def date_range_filter(from_date: Optional[datetime], to_date: Optional[datetime], field: str = "createdAt") -> Dict[str, Any]:
+    """Build an inclusive-from / exclusive-to filter on a date field."""
+    bounds = {}
+    if from_date:
+        bounds["$gte"] = from_date
+    if to_date:
+        bounds["$lt"] = to_date
+    return {field: bounds} if bounds else {}
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+async def stream_ndjson(cursor) -> AsyncIterator[bytes]:
+    """Yield one JSON document per line, flushing once per batch."""
+    buffer: List[str] = []
+    async for document in cursor:
+        buffer.append(json.dumps(document, default=_json_default, ensure_ascii=False))
+        if len(buffer) >= EXPORT_BATCH_SIZE:
+            yield ("\n".join(buffer) + "\n").encode("utf-8")
+            buffer = []
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode("utf-8")
+
+async def stream_csv(cursor, columns: List[str]) -> AsyncIterator[bytes]:
+    """Yield a header row and then CSV rows, flushing once per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    rows = 0
+    async for document in cursor:
+        writer.writerow([_csv_value(document.get(column)) for column in columns])
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
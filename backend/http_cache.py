@@ -0,0 +1,115 @@
+"""
+HTTP conditional GET helpers for G.M.B Travels Kashmir API
+ETag / Last-Modified validators and Cache-Control headers for public reads
+"""
+
+import os
+import gzip
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+from cache import catalog_cache
+
+# Cache-Control policy for public read endpoints
+PUBLIC_MAX_AGE = int(os.environ.get("PUBLIC_CACHE_MAX_AGE", "60"))
+PUBLIC_STALE_WHILE_REVALIDATE = int(os.environ.get("PUBLIC_CACHE_STALE_WHILE_REVALIDATE", "600"))
+
+class Fingerprint(NamedTuple):
+    count: int
+    last_modified: Optional[datetime]
+
+async def collection_fingerprint(collection, match: Dict[str, Any], field: str = "updatedAt") -> Fingerprint:
+    """Get document count and max(field) for a query.
+
+    The result is cached in the catalog cache under the collection's
+    namespace, so the same write-through invalidation keeps it fresh.
+    """
+    cache_key = ("fingerprint", repr(sorted(match.items())), field)
+    cached = catalog_cache.get(collection.name, cache_key)
+    if cached is not None:
+        return cached
+
+    generation = catalog_cache.generation(collection.name)
+    pipeline = [
+        {"$match": match},
+        {"$group": {"_id": None, "count": {"$sum": 1}, "last": {"$max": f"${field}"}}}
+    ]
+    rows = await collection.aggregate(pipeline).to_list(length=1)
+    fingerprint = Fingerprint(rows[0]["count"], rows[0]["last"]) if rows else Fingerprint(0, None)
+
+    catalog_cache.set(collection.name, cache_key, fingerprint, generation)
+    return fingerprint
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the given validator parts."""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against current validators.
+
+    Pass last_modified only for single-document resources: on a list, removing
+    the newest document leaves max(updatedAt) unchanged or moves it backwards,
+    so lists must be validated by their ETag alone.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: ignore the W/ prefix on both sides
+        current = etag[2:] if etag.startswith("W/") else etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == current:
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        return modified.replace(microsecond=0) <= since
+
+    return False
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """Validator and Cache-Control headers for a public response."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={PUBLIC_MAX_AGE}, stale-while-revalidate={PUBLIC_STALE_WHILE_REVALIDATE}"
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """Attach validator and Cache-Control headers to a 200 response."""
+    response.headers.update(cache_headers(etag, last_modified))
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
+
+def gzip_json_response(request: Request, payload: bytes, headers: Dict[str, str]) -> Response:
+    """Send a pre-gzipped JSON body, inflating it only for clients without gzip support."""
+    headers = dict(headers, Vary="Accept-Encoding")
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=payload, media_type="application/json", headers=headers)
+    return Response(content=gzip.decompress(payload), media_type="application/json", headers=headers)
@@ -0,0 +1,154 @@
+"""
+Login throttling for G.M.B Travels Kashmir API
+Sliding-window attempt counts per username and per client IP, with progressive lockout
+"""
+
+import os
+import math
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+LOGIN_WINDOW_SECONDS = float(os.environ.get("LOGIN_WINDOW_SECONDS", "900"))
+LOGIN_MAX_FAILURES_PER_USER = int(os.environ.get("LOGIN_MAX_FAILURES_PER_USER", "5"))
+LOGIN_MAX_FAILURES_PER_IP = int(os.environ.get("LOGIN_MAX_FAILURES_PER_IP", "20"))
+# Each lockout of the same key doubles, starting here and capped at the maximum
+LOGIN_LOCKOUT_BASE_SECONDS = float(os.environ.get("LOGIN_LOCKOUT_BASE_SECONDS", "60"))
+LOGIN_LOCKOUT_MAX_SECONDS = float(os.environ.get("LOGIN_LOCKOUT_MAX_SECONDS", "3600"))
+# "memory" keeps counters per process; "mongo" shares them between workers
+LOGIN_THROTTLE_STORE = os.environ.get("LOGIN_THROTTLE_STORE", "memory").lower()
+# Most keys the memory store tracks; the least recently written are forgotten first
+LOGIN_THROTTLE_MAX_KEYS = int(os.environ.get("LOGIN_THROTTLE_MAX_KEYS", "10000"))
+
+def _empty_state() -> Dict[str, Any]:
+    return {"attempts": [], "strikes": 0, "lockedUntil": 0.0}
+
+class MemoryThrottleStore:
+    def __init__(self):
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def load(self, key: str) -> Dict[str, Any]:
+        state = self._states.get(key)
+        if state is None or state["expiresAt"] <= time.time():
+            return _empty_state()
+        return state
+
+    async def save(self, key: str, state: Dict[str, Any], expires_at: float):
+        self._states[key] = dict(state, expiresAt=expires_at)
+        self._states.move_to_end(key)
+        # Forget the stalest keys so a spray of usernames cannot grow memory without bound
+        while len(self._states) > LOGIN_THROTTLE_MAX_KEYS:
+            self._states.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._states.pop(key, None)
+
+class MongoThrottleStore:
+    """Counters in the login_throttle collection; expired keys are removed by a TTL index.
+
+    Concurrent attempts on different workers may occasionally overwrite each
+    other, which only makes the limit slightly more lenient.
+    """
+
+    @property
+    def collection(self):
+        from database import get_database
+        return get_database().login_throttle
+
+    async def load(self, key: str) -> Dict[str, Any]:
+        document = await self.collection.find_one({"_id": key})
+        return dict(_empty_state(), **document) if document else _empty_state()
+
+    async def save(self, key: str, state: Dict[str, Any], expires_at: float):
+        document = {
+            "attempts": state["attempts"],
+            "strikes": state["strikes"],
+            "lockedUntil": state["lockedUntil"],
+            "expiresAt": datetime.utcfromtimestamp(expires_at)
+        }
+        await self.collection.replace_one({"_id": key}, document, upsert=True)
+
+    async def delete(self, key: str):
+        await self.collection.delete_one({"_id": key})
+
+class LoginThrottle:
+    def __init__(self, store):
+        self.store = store
+
+    @staticmethod
+    def keys(scope: str, username: str, request: Request) -> Dict[str, int]:
+        """Throttle keys for a login attempt, mapped to their attempt limits."""
+        client_ip = request.client.host if request.client else "unknown"
+        return {
+            f"user:{scope}:{username.strip().lower()}": LOGIN_MAX_FAILURES_PER_USER,
+            f"ip:{client_ip}": LOGIN_MAX_FAILURES_PER_IP
+        }
+
+    @staticmethod
+    def _rejected(retry_after: float) -> HTTPException:
+        return HTTPException(
+            status_code=429,
+            detail="Too many failed login attempts, please try again later",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+
+    async def register_attempt(self, keys: Dict[str, int]) -> float:
+        """Count a login attempt before any password is checked, rejecting it with 429 when over the limit.
+
+        The attempt is recorded up front, so a concurrent burst cannot all get
+        past the check and run bcrypt. Returns the attempt's timestamp for
+        record_success.
+        """
+        now = time.time()
+        retry_after = 0.0
+        for key, limit in keys.items():
+            state = await self.store.load(key)
+            attempts: List[float] = [stamp for stamp in state["attempts"] if stamp > now - LOGIN_WINDOW_SECONDS]
+            strikes = state["strikes"]
+            locked_until = state["lockedUntil"]
+
+            if locked_until > now:
+                retry_after = max(retry_after, locked_until - now)
+                continue
+            if len(attempts) >= limit:
+                lockout = min(LOGIN_LOCKOUT_BASE_SECONDS * 2 ** strikes, LOGIN_LOCKOUT_MAX_SECONDS)
+                strikes += 1
+                locked_until = now + lockout
+                attempts = []
+                retry_after = max(retry_after, lockout)
+                logger.warning(f"Login throttled for {key} for {lockout:.0f}s")
+            else:
+                attempts.append(now)
+
+            # Keep strikes around long enough to escalate a repeat offender
+            expires_at = max(now + LOGIN_WINDOW_SECONDS, locked_until) + LOGIN_LOCKOUT_MAX_SECONDS
+            await self.store.save(key, {"attempts": attempts, "strikes": strikes, "lockedUntil": locked_until}, expires_at)
+
+        if retry_after > 0:
+            raise self._rejected(retry_after)
+        return now
+
+    async def record_success(self, keys: Dict[str, int], attempt: float):
+        """Clear the username's history and take the attempt back off the IP's window.
+
+        The IP's earlier attempts stay, so one valid login cannot reset a spray.
+        """
+        for key in keys:
+            if key.startswith("user:"):
+                await self.store.delete(key)
+                continue
+            state = await self.store.load(key)
+            if attempt in state["attempts"]:
+                attempts = list(state["attempts"])
+                attempts.remove(attempt)
+                expires_at = max(attempt + LOGIN_WINDOW_SECONDS, state["lockedUntil"]) + LOGIN_LOCKOUT_MAX_SECONDS
+                await self.store.save(key, {"attempts": attempts, "strikes": state["strikes"], "lockedUntil": state["lockedUntil"]}, expires_at)
+
+# Global instance
+login_throttle = LoginThrottle(MongoThrottleStore() if LOGIN_THROTTLE_STORE == "mongo" else MemoryThrottleStore())
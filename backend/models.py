@@ -25,6 +25,10 @@ class PackageStatus(str, Enum):
     active = "active"
     inactive = "inactive"
 
+class PackageView(str, Enum):
+    full = "full"
+    summary = "summary"
+
 class TripType(str, Enum):
     oneway = "oneway"
     roundtrip = "roundtrip"
@@ -58,6 +62,75 @@ class Package(BaseModel):
     class Config:
         populate_by_name = True
 
+class PackageSummary(BaseModel):
+    """Listing-card view of a package; see PACKAGE_SUMMARY_PROJECTION."""
+    id: str = Field(alias="_id")
+    title: str
+    duration: str
+    price: float
+    image: str
+    category: str = "standard"
+
+    class Config:
+        populate_by_name = True
+
+# Mongo projection matching PackageSummary (_id is always returned)
+PACKAGE_SUMMARY_PROJECTION = {"title": 1, "duration": 1, "price": 1, "image": 1, "category": 1}
+
+# PDF Brochure Models
+class PDFProfile(str, Enum):
+    print = "print"
+    screen = "screen"
+    whatsapp = "whatsapp"
+
+class BrochureClientInfo(BaseModel):
+    name: str
+    email: str = ""
+    phone: str = ""
+    travel_date: str = "To be confirmed"
+    travelers: int = 1
+
+class BulkBrochureItem(BaseModel):
+    package_id: str
+    client_info: Optional[BrochureClientInfo] = None
+
+class BulkBrochureRequest(BaseModel):
+    items: List[BulkBrochureItem] = Field(min_length=1, max_length=1000)
+    layout: str = "brochure"
+    profile: PDFProfile = PDFProfile.print
+
+class PDFJobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+class PDFJob(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
+    packageId: str
+    clientInfo: Optional[BrochureClientInfo] = None
+    layout: str = "brochure"
+    profile: PDFProfile = PDFProfile.print
+    status: PDFJobStatus = PDFJobStatus.queued
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None  # filename, url, size of the rendered PDF
+    downloadUrl: Optional[str] = None
+    error: Optional[str] = None
+    createdBy: Optional[str] = None
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
+    createdAt: datetime = Field(default_factory=datetime.utcnow)
+    updatedAt: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        populate_by_name = True
+
+class PDFJobCreate(BaseModel):
+    package_id: str
+    client_info: Optional[BrochureClientInfo] = None
+    layout: str = "brochure"
+    profile: PDFProfile = PDFProfile.print
+
 class PackageCreate(BaseModel):
     title: str
     description: str
@@ -248,6 +321,10 @@ class AdminLogin(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 # Dashboard Stats
 class DashboardStats(BaseModel):
@@ -0,0 +1,50 @@
+"""
+Render-ready package detail snapshots for G.M.B Travels Kashmir API
+Serialized, gzipped detail bodies materialized whenever a package is written
+"""
+
+import gzip
+import logging
+from typing import Any, Dict, Optional
+
+from bson import Binary
+
+from cache import catalog_cache
+from database import get_database
+from http_cache import make_etag
+from serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+async def write_snapshot(package: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Materialize the detail body for a package document, or drop it if the package is not public."""
+    if package.get("status") != "active":
+        await delete_snapshot(package["_id"])
+        return None
+
+    snapshot = {
+        "_id": package["_id"],
+        "etag": make_etag("package", package["_id"], package.get("updatedAt")),
+        "lastModified": package.get("updatedAt"),
+        "body": Binary(gzip.compress(dumps(package)))
+    }
+    await get_database().package_snapshots.replace_one({"_id": package["_id"]}, snapshot, upsert=True)
+
+    # Snapshots live in the packages namespace so package writes drop them too
+    catalog_cache.set("packages", ("snapshot", package["_id"]), snapshot)
+    return snapshot
+
+async def delete_snapshot(package_id: str) -> None:
+    """Remove a package's snapshot."""
+    await get_database().package_snapshots.delete_one({"_id": package_id})
+    catalog_cache.invalidate("packages")
+
+async def get_snapshot(package_id: str) -> Optional[Dict[str, Any]]:
+    """Get a package's snapshot from memory or the side collection."""
+    snapshot = catalog_cache.get("packages", ("snapshot", package_id))
+    if snapshot is None:
+        generation = catalog_cache.generation("packages")
+        snapshot = await get_database().package_snapshots.find_one({"_id": package_id})
+        if snapshot is not None:
+            catalog_cache.set("packages", ("snapshot", package_id), snapshot, generation)
+    return snapshot
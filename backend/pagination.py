@@ -0,0 +1,84 @@
+"""
+Keyset pagination for G.M.B Travels Kashmir admin list endpoints
+Pages are ordered newest first on (createdAt, _id) and addressed by opaque cursors
+"""
+
+import os
+import json
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException, Query, Response
+
+# Matches the old fixed to_list(1000), which the admin screens that don't follow cursors still rely on
+DEFAULT_PAGE_SIZE = int(os.environ.get("ADMIN_PAGE_SIZE", "1000"))
+MAX_PAGE_SIZE = int(os.environ.get("ADMIN_MAX_PAGE_SIZE", "1000"))
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+SORT_ORDER = [("createdAt", -1), ("_id", -1)]
+
+class PageParams(NamedTuple):
+    cursor: Optional[str]
+    limit: int
+
+def page_params(
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+) -> PageParams:
+    """Query parameters shared by paginated endpoints."""
+    return PageParams(cursor, limit)
+
+def encode_cursor(document: Dict[str, Any]) -> str:
+    """Encode the sort key of the last document on a page."""
+    doc_id = document["_id"]
+    payload = {
+        "c": document["createdAt"].isoformat(),
+        "i": str(doc_id),
+        "o": isinstance(doc_id, ObjectId)
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """Decode a cursor back into its (createdAt, _id) sort key."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(payload["c"])
+        doc_id = ObjectId(payload["i"]) if payload.get("o") else payload["i"]
+        return created_at, doc_id
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_query(filters: Dict[str, Any], cursor: Optional[str]) -> Dict[str, Any]:
+    """Combine endpoint filters with the 'after this cursor' condition."""
+    if not cursor:
+        return filters
+    created_at, doc_id = decode_cursor(cursor)
+    after_cursor = {"$or": [
+        {"createdAt": {"$lt": created_at}},
+        {"createdAt": created_at, "_id": {"$lt": doc_id}}
+    ]}
+    return {"$and": [filters, after_cursor]} if filters else after_cursor
+
+async def fetch_page(collection, filters: Dict[str, Any], page: PageParams, projection=None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Fetch one page of documents and the cursor for the next page."""
+    cursor = collection.find(keyset_query(filters, page.cursor), projection).sort(SORT_ORDER)
+    # Read one extra row to learn whether another page exists
+    documents = await cursor.limit(page.limit + 1).to_list(length=page.limit + 1)
+
+    next_cursor = None
+    if len(documents) > page.limit:
+        documents = documents[:page.limit]
+        next_cursor = encode_cursor(documents[-1])
+
+    return documents, next_cursor
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next-page cursor on the response."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
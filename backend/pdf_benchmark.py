@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+PDF Rendering Benchmark for G.M.B Travels Kashmir
+Renders synthetic sample packages offline and checks time, memory and size against a baseline
+
+    python pdf_benchmark.py                    # compare against pdf_benchmark_baseline.json
+    python pdf_benchmark.py --write-baseline   # record the current numbers as the baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+BACKEND_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+DEFAULT_BASELINE = BACKEND_DIR / "pdf_benchmark_baseline.json"
+DEFAULT_DAYS = [3, 7, 14, 30]
+DEFAULT_IMAGES = [0, 8]
+# Source images are larger than print size so the downscaling cache is exercised
+IMAGE_SIZE = (2400, 1600)
+
+class Case(NamedTuple):
+    days: int
+    images: int
+    with_client: bool
+
+    @property
+    def name(self) -> str:
+        return f"{self.days}d-{self.images}img-{'client' if self.with_client else 'generic'}"
+
+def build_cases(days: List[int], images: List[int]) -> List[Case]:
+    cases = [Case(day_count, image_count, True) for day_count in days for image_count in images]
+    # Client info only adds a small block, so one generic case is enough to track it
+    cases.append(Case(7 if 7 in days else days[0], images[-1], False))
+    return cases
+
+def write_images(upload_dir: Path, count: int):
+    """Create synthetic JPEGs under uploads/ so renders never touch the network."""
+    from PIL import Image
+
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    gradient = Image.linear_gradient("L").resize(IMAGE_SIZE)
+    for index in range(count):
+        tint = Image.new("RGB", IMAGE_SIZE, ((index * 67) % 256, (index * 131) % 256, (index * 29) % 256))
+        Image.composite(tint, Image.new("RGB", IMAGE_SIZE, "white"), gradient).save(
+            upload_dir / f"image_{index}.jpg", quality=90
+        )
+
+def peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_case(case: Case, workdir: str, repeats: int) -> Dict[str, Any]:
+    """Render one case in a fresh process so peak RSS belongs to this case alone."""
+    os.chdir(workdir)
+    os.environ["PDF_IMAGE_CACHE_DIR"] = str(Path(workdir) / "image-cache" / case.name)
+
+    from pdf_generator import generate_sample_pdf, warm_renderer
+
+    warm_renderer()
+    images = [f"/uploads/benchmark/image_{index}.jpg" for index in range(case.images)]
+
+    timings = []
+    size = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pdf = generate_sample_pdf(case.days, images, case.with_client, persist=False)
+        timings.append(time.perf_counter() - start)
+        size = len(pdf)
+
+    # The first render fills the image cache; later ones show the steady state
+    warm = timings[1:] or timings
+    return {
+        "render_seconds": round(statistics.median(warm), 4),
+        "cold_seconds": round(timings[0], 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "size_kb": round(size / 1024, 1)
+    }
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerances: Dict[str, float]) -> bool:
+    """Print each case against its baseline; return False if any metric regressed."""
+    success = True
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            print(f"➖ NEW  {name}: no baseline")
+            continue
+
+        regressions = []
+        for metric, tolerance in tolerances.items():
+            limit = expected[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(f"{metric} {metrics[metric]} > {expected[metric]} (+{tolerance:.0%})")
+
+        if regressions:
+            success = False
+            print(f"❌ FAIL {name}: " + "; ".join(regressions))
+        else:
+            print(f"✅ PASS {name}")
+    return success
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark brochure PDF rendering")
+    parser.add_argument("--days", type=lambda value: [int(v) for v in value.split(",")], default=DEFAULT_DAYS,
+                        help="Comma-separated itinerary lengths (default: 3,7,14,30)")
+    parser.add_argument("--images", type=lambda value: [int(v) for v in value.split(",")], default=DEFAULT_IMAGES,
+                        help="Comma-separated counts of distinct local images (default: 0,8)")
+    parser.add_argument("--repeats", type=int, default=3, help="Renders per case (default: 3)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--write-baseline", action="store_true", help="Save results as the new baseline")
+    parser.add_argument("--output", type=Path, help="Also write results to this JSON file")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="Allowed render time increase (default: 0.25)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.15, help="Allowed peak RSS increase (default: 0.15)")
+    parser.add_argument("--size-tolerance", type=float, default=0.10, help="Allowed output size increase (default: 0.10)")
+    args = parser.parse_args()
+
+    cases = build_cases(args.days, args.images)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="gmb_pdf_benchmark_") as workdir:
+        write_images(Path(workdir) / "uploads" / "benchmark", max(args.images))
+
+        print(f"{'case':<22}{'render s':>10}{'cold s':>10}{'peak MB':>10}{'size KB':>10}")
+        for case in cases:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                metrics = executor.submit(run_case, case, workdir, args.repeats).result()
+            results[case.name] = metrics
+            print(f"{case.name:<22}{metrics['render_seconds']:>10}{metrics['cold_seconds']:>10}"
+                  f"{metrics['peak_rss_mb']:>10}{metrics['size_kb']:>10}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.write_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --write-baseline to record one")
+        return
+
+    print()
+    success = compare(results, json.loads(args.baseline.read_text()), {
+        "render_seconds": args.time_tolerance,
+        "peak_rss_mb": args.memory_tolerance,
+        "size_kb": args.size_tolerance
+    })
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Bulk brochure jobs for G.M.B Travels Kashmir API
+Renders many personalised brochures in parallel on the PDF pool and streams them back as one ZIP
+"""
+
+import io
+import os
+import re
+import uuid
+import shutil
+import asyncio
+import logging
+import tempfile
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pdf_generator import pdf_download_name
+from pdf_pool import pdf_render_pool, PDFQueueFull
+
+logger = logging.getLogger(__name__)
+
+BULK_WORK_DIR = Path(os.environ.get("PDF_BULK_WORK_DIR", Path(tempfile.gettempdir()) / "gmb_brochure_bulk"))
+# Finished jobs (and their files) are dropped after this long
+BULK_JOB_TTL_SECONDS = float(os.environ.get("PDF_BULK_JOB_TTL_SECONDS", "3600"))
+# How long a render waits before retrying when the pool queue is full
+BULK_RETRY_DELAY_SECONDS = 1.0
+ZIP_CHUNK_SIZE = 1024 * 1024
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable write target that hands ZIP bytes back in chunks."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def iter_zip(entries: List[Tuple[str, Path]]) -> Iterator[bytes]:
+    """Stream a ZIP of the given (name, path) entries without building it in memory or on disk."""
+    sink = _ZipSink()
+    # PDFs are already compressed, so store them as-is
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for arcname, path in entries:
+            with open(path, "rb") as source, archive.open(arcname, "w", force_zip64=True) as target:
+                while chunk := source.read(ZIP_CHUNK_SIZE):
+                    target.write(chunk)
+                    yield sink.drain()
+    yield sink.drain()
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")[:40]
+
+class BulkBrochureJob:
+    def __init__(self, total: int, layout: str, profile: str):
+        self.id = str(uuid.uuid4())
+        self.layout = layout
+        self.profile = profile
+        self.total = total
+        self.completed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.entries: List[Tuple[str, Path]] = []
+        self.status = "running"
+        self.createdAt = datetime.utcnow()
+        self.finishedAt: Optional[datetime] = None
+        self.work_dir = BULK_WORK_DIR / self.id
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "errors": self.errors,
+            "createdAt": self.createdAt,
+            "finishedAt": self.finishedAt,
+            "downloadUrl": f"/api/admin/pdf-bulk/{self.id}/download" if self.entries and self.status != "running" else None
+        }
+
+    def fail(self, index: int, package_id: str, error: str):
+        self.errors.append({"index": index, "package_id": package_id, "error": error})
+
+class BulkBrochureJobs:
+    """In-process registry of bulk jobs; progress is only visible on the worker that started the job."""
+
+    def __init__(self):
+        self._jobs: Dict[str, BulkBrochureJob] = {}
+
+    def get(self, job_id: str) -> Optional[BulkBrochureJob]:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def start(self, items: List[Dict[str, Any]], packages: Dict[str, Dict[str, Any]], layout: str, profile: str) -> BulkBrochureJob:
+        """Start rendering items ({package_id, client_info}) in the background."""
+        self._purge_expired()
+        job = BulkBrochureJob(len(items), layout, profile)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, items, packages))
+        return job
+
+    async def _run(self, job: BulkBrochureJob, items: List[Dict[str, Any]], packages: Dict[str, Dict[str, Any]]):
+        job.work_dir.mkdir(parents=True, exist_ok=True)
+        # Keep at most one render per worker in flight so interactive requests still get queue slots
+        slots = asyncio.Semaphore(pdf_render_pool.workers)
+
+        async def render(index: int, item: Dict[str, Any]):
+            package = packages.get(item["package_id"])
+            if not package:
+                job.fail(index, item["package_id"], "Package not found")
+                return
+
+            client_info = item.get("client_info")
+            stem = Path(pdf_download_name(package)).stem
+            if client_info:
+                stem = f"{stem}_{_slug(client_info['name'])}"
+            arcname = f"{index + 1:04d}_{stem}.pdf"
+
+            async with slots:
+                while True:
+                    try:
+                        pdf_bytes = await pdf_render_pool.render_bytes(package, client_info, job.layout, job.profile)
+                        break
+                    except PDFQueueFull:
+                        await asyncio.sleep(BULK_RETRY_DELAY_SECONDS)
+                    except Exception as e:
+                        logger.error(f"Bulk brochure {job.id} item {index} error: {e}")
+                        job.fail(index, item["package_id"], "Failed to generate PDF")
+                        return
+
+            path = job.work_dir / arcname
+            await asyncio.to_thread(path.write_bytes, pdf_bytes)
+            job.entries.append((arcname, path))
+            job.completed += 1
+
+        try:
+            await asyncio.gather(*(render(index, item) for index, item in enumerate(items)))
+            job.entries.sort()
+            job.status = "completed" if job.entries else "failed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        finally:
+            job.finishedAt = datetime.utcnow()
+            logger.info(f"Bulk brochure job {job.id} {job.status}: {job.completed}/{job.total} rendered")
+
+    def _purge_expired(self):
+        now = datetime.utcnow()
+        for job_id, job in list(self._jobs.items()):
+            if job.finishedAt and (now - job.finishedAt).total_seconds() > BULK_JOB_TTL_SECONDS:
+                shutil.rmtree(job.work_dir, ignore_errors=True)
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        """Cancel running jobs and remove all job files."""
+        for job in self._jobs.values():
+            if job.task and not job.task.done():
+                job.task.cancel()
+            shutil.rmtree(job.work_dir, ignore_errors=True)
+        self._jobs.clear()
+
+# Global instance
+bulk_brochure_jobs = BulkBrochureJobs()
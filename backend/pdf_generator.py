@@ -1,534 +1,189 @@
 import os
-from jinja2 import Template
+import re
+import json
+import hashlib
+import tempfile
+from functools import lru_cache, partial
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 from pathlib import Path
 import base64
 import requests
 from datetime import datetime
 
-class PackagePDFGenerator:
-    def __init__(self):
-        self.template_dir = Path(__file__).parent / 'templates'
-        self.template_dir.mkdir(exist_ok=True)
-        
-    def create_package_pdf(self, package_data, client_info=None):
-        """Generate a beautiful PDF matching the Kashmir package format"""
-        
-        # HTML template matching the exact format from your PDF
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>{{ package.title }} - G.M.B Travels Kashmir</title>
-            <style>
-                @page {
-                    size: A4;
-                    margin: 20mm;
-                }
-                
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }
-                
-                body {
-                    font-family: 'Arial', sans-serif;
-                    line-height: 1.4;
-                    color: #333;
-                    background: #fff;
-                }
-                
-                .header {
-                    text-align: center;
-                    margin-bottom: 30px;
-                    border-bottom: 3px solid #D97706;
-                    padding-bottom: 20px;
-                }
-                
-                .header h1 {
-                    font-size: 28px;
-                    color: #D97706;
-                    font-weight: bold;
-                    margin-bottom: 10px;
-                }
-                
-                .header .subtitle {
-                    font-size: 14px;
-                    color: #666;
-                    font-style: italic;
-                }
-                
-                .hero-image {
-                    width: 100%;
-                    height: 200px;
-                    object-fit: cover;
-                    border-radius: 8px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-                }
-                
-                .package-overview {
-                    background: linear-gradient(135deg, #FEF3E2, #FDE68A);
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin-bottom: 25px;
-                    border-left: 5px solid #D97706;
-                }
-                
-                .package-overview h2 {
-                    color: #92400E;
-                    font-size: 20px;
-                    margin-bottom: 10px;
-                }
-                
-                .package-details {
-                    display: flex;
-                    justify-content: space-between;
-                    margin-bottom: 15px;
-                }
-                
-                .package-details .detail-item {
-                    flex: 1;
-                    text-align: center;
-                    padding: 10px;
-                    background: white;
-                    margin: 0 5px;
-                    border-radius: 6px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }
-                
-                .detail-item .value {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #D97706;
-                }
-                
-                .detail-item .label {
-                    font-size: 12px;
-                    color: #666;
-                    text-transform: uppercase;
-                }
-                
-                .day-section {
-                    margin-bottom: 25px;
-                    page-break-inside: avoid;
-                    border: 1px solid #E5E7EB;
-                    border-radius: 8px;
-                    overflow: hidden;
-                }
-                
-                .day-header {
-                    background: linear-gradient(135deg, #1F2937, #374151);
-                    color: white;
-                    padding: 15px 20px;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-                
-                .day-content {
-                    padding: 20px;
-                    background: #FAFAFA;
-                }
-                
-                .day-image {
-                    width: 100%;
-                    height: 150px;
-                    object-fit: cover;
-                    border-radius: 6px;
-                    margin-bottom: 15px;
-                    box-shadow: 0 2px 6px rgba(0,0,0,0.1);
-                }
-                
-                .day-description {
-                    font-size: 14px;
-                    line-height: 1.6;
-                    margin-bottom: 15px;
-                }
-                
-                .themes {
-                    margin-bottom: 10px;
-                }
-                
-                .themes strong {
-                    color: #D97706;
-                }
-                
-                .accommodation {
-                    background: #EFF6FF;
-                    padding: 10px;
-                    border-radius: 6px;
-                    border-left: 4px solid #3B82F6;
-                    font-size: 13px;
-                }
-                
-                .accommodation strong {
-                    color: #1D4ED8;
-                }
-                
-                .section-title {
-                    background: #D97706;
-                    color: white;
-                    padding: 15px 20px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    margin: 30px 0 20px 0;
-                    border-radius: 6px;
-                }
-                
-                .inclusions-grid {
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                    margin-bottom: 25px;
-                }
-                
-                .inclusions, .exclusions {
-                    background: #F9FAFB;
-                    padding: 15px;
-                    border-radius: 6px;
-                    border: 1px solid #E5E7EB;
-                }
-                
-                .inclusions h4 {
-                    color: #059669;
-                    margin-bottom: 10px;
-                    font-size: 16px;
-                }
-                
-                .exclusions h4 {
-                    color: #DC2626;
-                    margin-bottom: 10px;
-                    font-size: 16px;
-                }
-                
-                .inclusions ul, .exclusions ul {
-                    list-style: none;
-                    padding: 0;
-                }
-                
-                .inclusions li {
-                    padding: 5px 0;
-                    font-size: 13px;
-                    position: relative;
-                    padding-left: 20px;
-                }
-                
-                .inclusions li:before {
-                    content: "✓";
-                    color: #059669;
-                    font-weight: bold;
-                    position: absolute;
-                    left: 0;
-                }
-                
-                .exclusions li {
-                    padding: 5px 0;
-                    font-size: 13px;
-                    position: relative;
-                    padding-left: 20px;
-                }
-                
-                .exclusions li:before {
-                    content: "✗";
-                    color: #DC2626;
-                    font-weight: bold;
-                    position: absolute;
-                    left: 0;
-                }
-                
-                .pricing-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                    background: white;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                    border-radius: 8px;
-                    overflow: hidden;
-                }
-                
-                .pricing-table th {
-                    background: #D97706;
-                    color: white;
-                    padding: 15px;
-                    text-align: center;
-                    font-weight: bold;
-                }
-                
-                .pricing-table td {
-                    padding: 15px;
-                    text-align: center;
-                    border-bottom: 1px solid #E5E7EB;
-                }
-                
-                .pricing-table .price {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #D97706;
-                }
-                
-                .accommodation-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                    background: white;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                    border-radius: 8px;
-                    overflow: hidden;
-                }
-                
-                .accommodation-table th {
-                    background: #1F2937;
-                    color: white;
-                    padding: 15px;
-                    text-align: left;
-                    font-weight: bold;
-                }
-                
-                .accommodation-table td {
-                    padding: 12px 15px;
-                    border-bottom: 1px solid #E5E7EB;
-                    font-size: 14px;
-                }
-                
-                .terms-section {
-                    background: #FEF3E2;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin: 25px 0;
-                    border-left: 5px solid #D97706;
-                }
-                
-                .terms-section h4 {
-                    color: #92400E;
-                    margin-bottom: 10px;
-                    font-size: 16px;
-                }
-                
-                .terms-section ul {
-                    font-size: 13px;
-                    line-height: 1.6;
-                    padding-left: 20px;
-                }
-                
-                .terms-section li {
-                    margin-bottom: 5px;
-                }
-                
-                .footer {
-                    text-align: center;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 2px solid #D97706;
-                }
-                
-                .footer h3 {
-                    color: #D97706;
-                    font-size: 20px;
-                    margin-bottom: 10px;
-                }
-                
-                .footer p {
-                    color: #666;
-                    font-size: 14px;
-                }
-                
-                .client-info {
-                    background: #EFF6FF;
-                    padding: 15px;
-                    border-radius: 8px;
-                    margin-bottom: 20px;
-                    border-left: 4px solid #3B82F6;
-                }
-                
-                .client-info h3 {
-                    color: #1D4ED8;
-                    margin-bottom: 10px;
-                }
-                
-                .page-break {
-                    page-break-before: always;
-                }
-            </style>
-        </head>
-        <body>
-            <!-- Header -->
-            <div class="header">
-                <h1>{{ package.duration }} {{ package.title }}</h1>
-                <p class="subtitle">Kashmir, known as "Paradise on Earth," is a captivating destination with its snow-capped mountains, pristine landscapes, and rich cultural heritage.</p>
-            </div>
+from pdf_images import IMAGE_MAX_PX, IMAGE_JPEG_QUALITY, brochure_url_fetcher
+
+# Brochure templates live in templates/<layout>.html (+ optional <layout>.css) and are compiled once per process
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+TEMPLATE_CACHE_DIR = Path(os.environ.get('PDF_TEMPLATE_CACHE_DIR', Path(tempfile.gettempdir()) / 'gmb_brochure_templates'))
+TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+DEFAULT_LAYOUT = 'brochure'
+
+template_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    bytecode_cache=FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+    # Only check template files for edits while developing
+    auto_reload=os.environ.get('ENVIRONMENT', 'production').lower() == 'development',
+    autoescape=select_autoescape(['html'])
+)
+
+# Generated PDFs are content-addressed, so identical requests reuse the same file
+PDF_DIR = Path("uploads") / "pdfs"
+PDF_CACHE_MAX_BYTES = int(os.environ.get('PDF_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+# Persisted PDFs older than this are removed by the retention sweeper (0 keeps them until evicted by size)
+PDF_RETENTION_MAX_AGE_SECONDS = float(os.environ.get('PDF_RETENTION_MAX_AGE_HOURS', '168')) * 3600
+
+# Output-size profiles: how far images are downscaled before layout and which write_pdf optimisations run
+PDF_PROFILES = {
+    'print': {'image_max_px': IMAGE_MAX_PX, 'jpeg_quality': IMAGE_JPEG_QUALITY, 'pdf_options': {}},
+    'screen': {'image_max_px': 1200, 'jpeg_quality': 75, 'pdf_options': {'optimize_images': True, 'jpeg_quality': 75, 'dpi': 150}},
+    'whatsapp': {'image_max_px': 800, 'jpeg_quality': 60, 'pdf_options': {'optimize_images': True, 'jpeg_quality': 60, 'dpi': 96}}
+}
+DEFAULT_PROFILE = 'print'
+
+def available_layouts():
+    """Names of the brochure layouts found in the templates directory"""
+    return sorted(path.stem for path in TEMPLATE_DIR.glob('*.html'))
 
-            {% if client_info %}
-            <!-- Client Information -->
-            <div class="client-info">
-                <h3>Prepared for: {{ client_info.name }}</h3>
-                <p><strong>Email:</strong> {{ client_info.email }} | <strong>Phone:</strong> {{ client_info.phone }}</p>
-                <p><strong>Travel Date:</strong> {{ client_info.travel_date }} | <strong>Travelers:</strong> {{ client_info.travelers }} people</p>
-                <p><strong>Generated on:</strong> {{ generated_date }}</p>
-            </div>
-            {% endif %}
+@lru_cache(maxsize=32)
+def _file_digest(path, mtime_ns):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
-            <!-- Hero Image -->
-            {% if package.image %}
-            <img src="{{ package.image }}" alt="{{ package.title }}" class="hero-image">
-            {% endif %}
+def template_version(layout=DEFAULT_LAYOUT):
+    """Content hash of a layout's template and stylesheet, so editing either invalidates cached PDFs"""
+    digests = []
+    for path in (TEMPLATE_DIR / f'{layout}.html', TEMPLATE_DIR / f'{layout}.css'):
+        if path.exists():
+            digests.append(_file_digest(str(path), path.stat().st_mtime_ns))
+    return hashlib.sha256('|'.join(digests).encode()).hexdigest()
 
-            <!-- Package Overview -->
-            <div class="package-overview">
-                <h2>Package Overview</h2>
-                <p>{{ package.description }}</p>
-                <div class="package-details">
-                    <div class="detail-item">
-                        <div class="value">{{ package.duration }}</div>
-                        <div class="label">Duration</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="value">{{ package.groupSize }}</div>
-                        <div class="label">Group Size</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="value">₹{{ "{:,}".format(package.price) }}</div>
-                        <div class="label">Price per Person</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="value">{{ package.category|title }}</div>
-                        <div class="label">Category</div>
-                    </div>
-                </div>
-            </div>
+@lru_cache(maxsize=1)
+def font_config():
+    """Process-wide font configuration, shared by every render"""
+    return FontConfiguration()
 
-            <!-- Day wise Itinerary -->
-            <div class="section-title">Day wise Itinerary</div>
-            
-            {% for day in package.itinerary %}
-            <div class="day-section">
-                <div class="day-header">
-                    Day {{ day.day }}: {{ day.title }}
-                </div>
-                <div class="day-content">
-                    {% if day.image %}
-                    <img src="{{ day.image }}" alt="Day {{ day.day }}" class="day-image">
-                    {% endif %}
-                    
-                    <div class="day-description">
-                        {{ day.description }}
-                    </div>
-                    
-                    {% if day.activities %}
-                    <div class="themes">
-                        <strong>Themes:</strong> {{ day.activities|join(', ') }}
-                    </div>
-                    {% endif %}
-                    
-                    {% if day.accommodation %}
-                    <div class="accommodation">
-                        <strong>Accommodation:</strong> {{ day.accommodation }}
-                    </div>
-                    {% endif %}
-                </div>
-            </div>
-            {% endfor %}
+@lru_cache(maxsize=16)
+def _parsed_stylesheet(path, mtime_ns):
+    return CSS(filename=path, font_config=font_config(), url_fetcher=brochure_url_fetcher)
 
-            <div class="page-break"></div>
+@lru_cache(maxsize=None)
+def profile_url_fetcher(profile=DEFAULT_PROFILE):
+    """Image fetcher bound to a profile's resolution and JPEG quality"""
+    settings = PDF_PROFILES[profile]
+    return partial(brochure_url_fetcher, max_px=settings['image_max_px'], jpeg_quality=settings['jpeg_quality'])
 
-            <!-- Inclusions & Exclusions -->
-            <div class="section-title">Package Inclusions & Exclusions</div>
-            <div class="inclusions-grid">
-                <div class="inclusions">
-                    <h4>✓ Inclusions</h4>
-                    <ul>
-                        {% for inclusion in package.inclusions %}
-                        <li>{{ inclusion }}</li>
-                        {% endfor %}
-                    </ul>
-                </div>
-                
-                <div class="exclusions">
-                    <h4>✗ Exclusions</h4>
-                    <ul>
-                        {% for exclusion in package.exclusions %}
-                        <li>{{ exclusion }}</li>
-                        {% endfor %}
-                    </ul>
-                </div>
-            </div>
+def layout_stylesheets(layout=DEFAULT_LAYOUT):
+    """Pre-parsed stylesheets for a layout, re-parsed only when the file changes"""
+    path = TEMPLATE_DIR / f'{layout}.css'
+    if not path.exists():
+        return []
+    return [_parsed_stylesheet(str(path), path.stat().st_mtime_ns)]
 
-            <!-- Pricing -->
-            <div class="section-title">Price & Rates</div>
-            <table class="pricing-table">
-                <thead>
-                    <tr>
-                        <th>No of Pax</th>
-                        <th>Age Limit</th>
-                        <th>Price per Pax (₹)</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td>{{ package.groupSize.split()[0] if package.groupSize else 'Multiple' }}</td>
-                        <td>Above 12 years</td>
-                        <td class="price">₹{{ "{:,}".format(package.price) }}</td>
-                    </tr>
-                </tbody>
-            </table>
-            <p style="font-style: italic; font-size: 12px; color: #666; margin-top: 10px;">
-                * Mentioned prices may vary depending upon date of travel, hotel availability, surge pricing and seasonal rush.
-            </p>
+def warm_renderer():
+    """Load fonts and parse every layout's stylesheet ahead of the first render"""
+    font_config()
+    for layout in available_layouts():
+        layout_stylesheets(layout)
 
-            <!-- Accommodation Details -->
-            {% if accommodation_details %}
-            <div class="section-title">Accommodation</div>
-            <table class="accommodation-table">
-                <thead>
-                    <tr>
-                        <th>City</th>
-                        <th>Hotel Name</th>
-                        <th>Star Rating</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for acc in accommodation_details %}
-                    <tr>
-                        <td>{{ acc.city }}</td>
-                        <td>{{ acc.hotel_name }}</td>
-                        <td>{{ acc.star_rating }}</td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-            {% endif %}
+def pdf_cache_key(package_data, client_info=None, layout=DEFAULT_LAYOUT, profile=DEFAULT_PROFILE):
+    """Hash of the package version, client info, template version and output profile"""
+    package_version = package_data.get('updatedAt')
+    if package_version is None:
+        # Documents without updatedAt (e.g. the sample package) are keyed on their content
+        package_version = hashlib.sha256(json.dumps(package_data, sort_keys=True, default=str).encode()).hexdigest()
+    
+    material = json.dumps({
+        'package': str(package_data.get('_id', '')),
+        'version': str(package_version),
+        'client': client_info,
+        'layout': layout,
+        'template': template_version(layout),
+        'profile': PDF_PROFILES[profile]
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+def pdf_download_name(package_data):
+    """Human-readable file name for a package brochure"""
+    slug = re.sub(r'[^a-z0-9]+', '_', package_data['title'].lower()).strip('_')[:60]
+    return f"package_{slug}.pdf"
 
-            <!-- Terms & Conditions -->
-            <div class="section-title">Terms & Conditions</div>
-            
-            <div class="terms-section">
-                <h4>Payment Terms & Methods:</h4>
-                <ul>
-                    <li>20% Advance Percentage of total booking amount</li>
-                    <li>Airfare/Transport fare to be paid full at one time in advance</li>
-                </ul>
-            </div>
+def pdf_cache_path(package_data, client_info=None, layout=DEFAULT_LAYOUT, profile=DEFAULT_PROFILE):
+    """Where the PDF for this package/client/template/profile combination is stored"""
+    stem = Path(pdf_download_name(package_data)).stem
+    return PDF_DIR / f"{stem}_{pdf_cache_key(package_data, client_info, layout, profile)[:24]}.pdf"
 
-            <div class="terms-section">
-                <h4>Cancellation & Refund Policy:</h4>
-                <ul>
-                    <li>Upon cancellation, refund will be made after deducting the Retention Amount</li>
-                    <li>Retention Amount varies as per the number of days left before your package start date</li>
-                    <li>Refund will be made within 15 working days from the date of receipt of the cancellation</li>
-                </ul>
-            </div>
+def _pdf_info(path, profile):
+    return {
+        'filename': path.name,
+        'filepath': str(path),
+        'url': f'/uploads/pdfs/{path.name}',
+        'size': os.path.getsize(path),
+        'profile': profile
+    }
 
-            <!-- Footer -->
-            <div class="footer">
-                <h3>G.M.B Tour And Travels</h3>
-                <p>Experience Paradise on Earth - Kashmir</p>
-                <p>Contact: +91 98765 43210 | Email: info@gmbtravelskashmir.com</p>
-                <p>Srinagar, Kashmir, India</p>
-            </div>
-        </body>
-        </html>
-        """
+def cached_package_pdf(package_data, client_info=None, layout=DEFAULT_LAYOUT, profile=DEFAULT_PROFILE):
+    """Return the already generated PDF for these inputs, or None"""
+    path = pdf_cache_path(package_data, client_info, layout, profile)
+    try:
+        # Bump mtime so LRU eviction sees the hit
+        os.utime(path)
+        return _pdf_info(path, profile)
+    except FileNotFoundError:
+        return None
+
+def evict_pdf_cache(max_bytes=PDF_CACHE_MAX_BYTES, max_age_seconds=None):
+    """Delete PDFs not used within max_age_seconds, then least recently used ones until the directory fits in max_bytes
+    
+    Returns the number of files removed.
+    """
+    cutoff = datetime.now().timestamp() - max_age_seconds if max_age_seconds else None
+    entries = []
+    removed = 0
+    for path in PDF_DIR.glob('*.pdf'):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if cutoff is not None and stat.st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            removed += 1
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+class PackagePDFGenerator:
+    def create_package_pdf(self, package_data, client_info=None, layout=DEFAULT_LAYOUT, profile=DEFAULT_PROFILE):
+        """Generate a beautiful PDF matching the Kashmir package format"""
+        
+        # Serve an identical earlier render instead of re-rendering
+        cached = cached_package_pdf(package_data, client_info, layout, profile)
+        if cached:
+            return cached
+        
+        pdf_bytes = self.render_package_pdf(package_data, client_info, layout, profile)
+        
+        # Write then rename so a concurrent reader never sees a partial file
+        full_pdf_path = pdf_cache_path(package_data, client_info, layout, profile)
+        PDF_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_pdf_path = full_pdf_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_pdf_path.write_bytes(pdf_bytes)
+        os.replace(tmp_pdf_path, full_pdf_path)
+        
+        evict_pdf_cache()
+        
+        return _pdf_info(full_pdf_path, profile)
+    
+    def render_package_pdf(self, package_data, client_info=None, layout=DEFAULT_LAYOUT, profile=DEFAULT_PROFILE):
+        """Render the package brochure and return the PDF bytes without touching disk"""
         
         # Prepare template data
         template_data = {
@@ -543,30 +198,25 @@ class PackagePDFGenerator:
         }
         
         # Render template
-        template = Template(html_template)
+        template = template_env.get_template(f'{layout}.html')
         html_content = template.render(**template_data)
         
-        # Generate PDF
-        pdf_filename = f"package_{package_data['title'].replace(' ', '_').lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        pdf_path = Path("uploads") / "pdfs"
-        pdf_path.mkdir(exist_ok=True)
-        
-        full_pdf_path = pdf_path / pdf_filename
-        
         # Create PDF with WeasyPrint
-        html_doc = HTML(string=html_content, base_url=".")
-        html_doc.write_pdf(str(full_pdf_path))
-        
-        return {
-            'filename': pdf_filename,
-            'filepath': str(full_pdf_path),
-            'url': f'/uploads/pdfs/{pdf_filename}',
-            'size': os.path.getsize(full_pdf_path)
-        }
+        html_doc = HTML(string=html_content, base_url=".", url_fetcher=profile_url_fetcher(profile))
+        return html_doc.write_pdf(
+            stylesheets=layout_stylesheets(layout),
+            font_config=font_config(),
+            **PDF_PROFILES[profile]['pdf_options']
+        )
 
 # Sample usage function
-def generate_sample_pdf():
-    """Generate a sample PDF for testing"""
+def sample_package_data(days=None, images=None):
+    """Sample package for testing
+    
+    days builds a synthetic itinerary of that length from the sample days. images is a list
+    of image URLs cycled over the hero and each day; None keeps the sample's remote images and
+    an empty list renders without images.
+    """
     
     sample_package = {
         'title': '7 Days Spiritual Journey Of Kashmir Tour',
@@ -614,15 +264,43 @@ def generate_sample_pdf():
         ]
     }
     
-    sample_client = {
+    if days is not None:
+        sample_days = sample_package['itinerary']
+        sample_package['title'] = f'{days} Days Spiritual Journey Of Kashmir Tour'
+        sample_package['duration'] = f'{days} Days {max(days - 1, 0)} Nights'
+        sample_package['itinerary'] = [
+            dict(sample_days[(number - 1) % len(sample_days)], day=number)
+            for number in range(1, days + 1)
+        ]
+    
+    if images is not None:
+        sample_package['image'] = images[0] if images else ''
+        for day in sample_package['itinerary']:
+            day['image'] = images[day['day'] % len(images)] if images else ''
+    
+    return sample_package
+
+def sample_client_data():
+    """Sample client details for a personalised brochure"""
+    return {
         'name': 'Rajesh Kumar',
         'email': 'rajesh.kumar@email.com',
         'phone': '+91 98765 43210',
         'travel_date': 'December 15, 2024',
         'travelers': 4
     }
+
+def generate_sample_pdf(days=None, images=None, with_client=True, persist=True):
+    """Generate a sample PDF for testing
+    
+    With persist=False the PDF is rendered in memory and its bytes are returned.
+    """
+    sample_package = sample_package_data(days, images)
+    sample_client = sample_client_data() if with_client else None
     
     generator = PackagePDFGenerator()
+    if not persist:
+        return generator.render_package_pdf(sample_package, sample_client)
     return generator.create_package_pdf(sample_package, sample_client)
 
 if __name__ == "__main__":
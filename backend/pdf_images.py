@@ -0,0 +1,160 @@
+"""
+Brochure image cache for G.M.B Travels Kashmir API
+WeasyPrint url_fetcher that serves images from a size-bounded on-disk cache, pre-downscaled to print resolution
+"""
+
+import io
+import os
+import hashlib
+import logging
+import mimetypes
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import requests
+from PIL import Image, UnidentifiedImageError
+from weasyprint import default_url_fetcher
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_DIR = Path(os.environ.get("PDF_IMAGE_CACHE_DIR", Path(tempfile.gettempdir()) / "gmb_brochure_images"))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("PDF_IMAGE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# A full-width A4 image at ~200 dpi
+IMAGE_MAX_PX = int(os.environ.get("PDF_IMAGE_MAX_PX", "1600"))
+IMAGE_JPEG_QUALITY = int(os.environ.get("PDF_IMAGE_JPEG_QUALITY", "85"))
+IMAGE_FETCH_TIMEOUT = float(os.environ.get("PDF_IMAGE_FETCH_TIMEOUT", "10"))
+
+UPLOAD_DIR = Path("uploads")
+UPLOAD_URL_PREFIX = "/uploads/"
+
+def _local_upload(url: str) -> Optional[Path]:
+    """Map an /uploads/... reference to the file on disk, if it is one."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("", "file"):
+        return None
+    path = unquote(parsed.path)
+    # With base_url="." a root-relative /uploads/x resolves to file:///uploads/x
+    if path.startswith(UPLOAD_URL_PREFIX):
+        relative = path[len(UPLOAD_URL_PREFIX):]
+    else:
+        marker = path.find(f"/{UPLOAD_DIR}/")
+        if marker == -1 or not Path(path).is_absolute():
+            return None
+        relative = path[marker + len(f"/{UPLOAD_DIR}/"):]
+
+    candidate = (UPLOAD_DIR / relative).resolve()
+    if UPLOAD_DIR.resolve() not in candidate.parents or not candidate.is_file():
+        return None
+    return candidate
+
+def _downscale(data: bytes, max_px: int, jpeg_quality: int) -> Tuple[bytes, str]:
+    """Shrink an image to max_px on its longest side and re-encode it."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((max_px, max_px))
+        output = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P"):
+            # Keep transparency (logos, icons) as PNG
+            image.save(output, format="PNG", optimize=True)
+            return output.getvalue(), "image/png"
+        image.convert("RGB").save(output, format="JPEG", quality=jpeg_quality, optimize=True, progressive=True)
+        return output.getvalue(), "image/jpeg"
+
+def _cache_path(source_key: str, max_px: int, jpeg_quality: int) -> Path:
+    digest = hashlib.sha256(f"{source_key}|{max_px}|{jpeg_quality}".encode()).hexdigest()
+    return IMAGE_CACHE_DIR / digest[:2] / digest
+
+def _read_cached(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = path.read_bytes()
+        # Bump mtime so LRU eviction sees the hit
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    mime_type = "image/png" if data[:8] == b"\x89PNG\r\n\x1a\n" else "image/jpeg"
+    return {"string": data, "mime_type": mime_type}
+
+def _store(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    evict_image_cache()
+
+def evict_image_cache(max_bytes: int = IMAGE_CACHE_MAX_BYTES) -> None:
+    """Delete least recently used images until the cache fits in max_bytes."""
+    entries = []
+    for path in IMAGE_CACHE_DIR.glob("*/*"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+def _cached_image(source_key: str, load, max_px: int, jpeg_quality: int) -> Optional[Dict[str, Any]]:
+    """Serve a downscaled image from the cache, loading and converting it on a miss.
+
+    Returns None when the source is not an image Pillow can read.
+    """
+    path = _cache_path(source_key, max_px, jpeg_quality)
+    cached = _read_cached(path)
+    if cached:
+        return cached
+
+    try:
+        data, mime_type = _downscale(load(), max_px, jpeg_quality)
+    except (UnidentifiedImageError, OSError):
+        return None
+    _store(path, data)
+    return {"string": data, "mime_type": mime_type}
+
+def brochure_url_fetcher(
+    url: str,
+    *args,
+    max_px: int = IMAGE_MAX_PX,
+    jpeg_quality: int = IMAGE_JPEG_QUALITY,
+    **kwargs
+) -> Dict[str, Any]:
+    """WeasyPrint url_fetcher for brochure renders.
+
+    Uploaded images are read from disk and remote images are fetched once;
+    both are served downscaled from the image cache. Anything else (data:
+    URLs, stylesheets, fonts, non-image responses) falls through to the
+    default fetcher. Bind max_px / jpeg_quality with functools.partial for
+    smaller output.
+    """
+    local = _local_upload(url)
+    if local is not None:
+        stat = local.stat()
+        result = _cached_image(f"{local}|{stat.st_mtime_ns}|{stat.st_size}", local.read_bytes, max_px, jpeg_quality)
+        if result:
+            return result
+        mime_type, _ = mimetypes.guess_type(str(local))
+        return {"string": local.read_bytes(), "mime_type": mime_type}
+
+    if urlparse(url).scheme in ("http", "https"):
+        cached = _read_cached(_cache_path(url, max_px, jpeg_quality))
+        if cached:
+            return cached
+
+        response = requests.get(url, timeout=IMAGE_FETCH_TIMEOUT)
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        if content_type.startswith("image/") and content_type != "image/svg+xml":
+            result = _cached_image(url, lambda: response.content, max_px, jpeg_quality)
+            if result:
+                return result
+        logger.debug(f"Serving {url} uncached ({content_type or 'unknown type'})")
+        return {"string": response.content, "mime_type": content_type or None, "redirected_url": response.url}
+
+    return default_url_fetcher(url, *args, **kwargs)
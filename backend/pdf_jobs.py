@@ -0,0 +1,139 @@
+"""
+Asynchronous PDF jobs for G.M.B Travels Kashmir API
+Brochure renders are queued in the pdf_jobs collection and run in the background, so requests return at once
+"""
+
+import os
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from pymongo import ReturnDocument
+
+from database import get_database
+from models import PDFJob, PDFJobStatus, PDFProfile
+from pdf_generator import PDF_DIR
+from pdf_pool import pdf_render_pool, PDFQueueFull
+
+logger = logging.getLogger(__name__)
+
+# Jobs left 'running' longer than this are assumed to belong to a dead worker and are requeued
+PDF_JOB_STALE_SECONDS = float(os.environ.get("PDF_JOB_STALE_SECONDS", "600"))
+PDF_JOB_MAX_ATTEMPTS = int(os.environ.get("PDF_JOB_MAX_ATTEMPTS", "3"))
+# How long a job waits before retrying when the pool queue is full
+PDF_JOB_RETRY_DELAY_SECONDS = 1.0
+
+class PDFJobRunner:
+    def __init__(self):
+        self._tasks: Set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def start(self):
+        """Pick up jobs that were queued or interrupted before this process started."""
+        self._slots = asyncio.Semaphore(pdf_render_pool.workers)
+        collection = get_database().pdf_jobs
+
+        stale_before = datetime.utcnow() - timedelta(seconds=PDF_JOB_STALE_SECONDS)
+        requeued = await collection.update_many(
+            {"status": PDFJobStatus.running, "startedAt": {"$lt": stale_before}},
+            {"$set": {"status": PDFJobStatus.queued, "updatedAt": datetime.utcnow()}}
+        )
+        if requeued.modified_count:
+            logger.info(f"Requeued {requeued.modified_count} interrupted PDF jobs")
+
+        async for job in collection.find({"status": PDFJobStatus.queued}, {"_id": 1}).sort("createdAt", 1):
+            self.submit(job["_id"])
+
+    def stop(self):
+        """Cancel in-flight jobs; they stay 'running' in Mongo and are requeued once stale."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    async def enqueue(self, job: PDFJob) -> PDFJob:
+        await get_database().pdf_jobs.insert_one(job.dict(by_alias=True))
+        self.submit(job.id)
+        return job
+
+    async def ensure_output(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Requeue a completed job whose PDF has since been evicted from the brochure cache.
+
+        Job output shares uploads/pdfs with cached brochures, so LRU eviction or the
+        retention sweeper can remove it; the caller keeps polling until it is rendered again.
+        """
+        if job["status"] != PDFJobStatus.completed or (PDF_DIR / job["result"]["filename"]).is_file():
+            return job
+
+        # Conditional on the finish time so concurrent pollers requeue it only once
+        requeued = await get_database().pdf_jobs.find_one_and_update(
+            {"_id": job["_id"], "status": PDFJobStatus.completed, "finishedAt": job.get("finishedAt")},
+            {"$set": {
+                "status": PDFJobStatus.queued, "attempts": 0, "result": None, "downloadUrl": None,
+                "finishedAt": None, "updatedAt": datetime.utcnow()
+            }},
+            return_document=ReturnDocument.AFTER
+        )
+        if not requeued:
+            return await get_database().pdf_jobs.find_one({"_id": job["_id"]}) or job
+        logger.info(f"Requeued PDF job {job['_id']}: its output was evicted")
+        self.submit(job["_id"])
+        return requeued
+
+    def submit(self, job_id: str):
+        task = asyncio.create_task(self._run(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job_id: str):
+        collection = get_database().pdf_jobs
+        async with self._slots:
+            # Claim atomically so only one worker process runs a given job
+            now = datetime.utcnow()
+            job = await collection.find_one_and_update(
+                {"_id": job_id, "status": PDFJobStatus.queued},
+                {"$set": {"status": PDFJobStatus.running, "startedAt": now, "updatedAt": now}, "$inc": {"attempts": 1}},
+                return_document=ReturnDocument.AFTER
+            )
+            if not job:
+                return
+
+            update: Dict[str, object]
+            try:
+                package = await get_database().packages.find_one({"_id": job["packageId"]})
+                if not package:
+                    update = {"status": PDFJobStatus.failed, "error": "Package not found"}
+                else:
+                    while True:
+                        try:
+                            result = await pdf_render_pool.render(
+                                package, job.get("clientInfo"), job["layout"], job.get("profile", PDFProfile.print.value)
+                            )
+                            break
+                        except PDFQueueFull:
+                            await asyncio.sleep(PDF_JOB_RETRY_DELAY_SECONDS)
+                    update = {
+                        "status": PDFJobStatus.completed,
+                        "result": {key: result[key] for key in ("filename", "url", "size", "profile")},
+                        "downloadUrl": result["url"],
+                        "error": None
+                    }
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"PDF job {job_id} error: {e}")
+                retry = job["attempts"] < PDF_JOB_MAX_ATTEMPTS
+                update = {
+                    "status": PDFJobStatus.queued if retry else PDFJobStatus.failed,
+                    "error": "Failed to generate PDF"
+                }
+                if retry:
+                    await collection.update_one({"_id": job_id}, {"$set": dict(update, updatedAt=datetime.utcnow())})
+                    self.submit(job_id)
+                    return
+
+            now = datetime.utcnow()
+            await collection.update_one({"_id": job_id}, {"$set": dict(update, finishedAt=now, updatedAt=now)})
+
+# Global instance
+pdf_job_runner = PDFJobRunner()
@@ -0,0 +1,154 @@
+"""
+PDF render pool for G.M.B Travels Kashmir API
+Runs WeasyPrint brochure rendering in worker processes so it never blocks the event loop
+"""
+
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from pdf_generator import (
+    PackagePDFGenerator, DEFAULT_LAYOUT, DEFAULT_PROFILE, PDF_CACHE_MAX_BYTES, PDF_RETENTION_MAX_AGE_SECONDS,
+    cached_package_pdf, evict_pdf_cache, warm_renderer
+)
+
+logger = logging.getLogger(__name__)
+
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", "2"))
+PDF_QUEUE_LIMIT = int(os.environ.get("PDF_QUEUE_LIMIT", "8"))
+PDF_RETENTION_SWEEP_SECONDS = float(os.environ.get("PDF_RETENTION_SWEEP_SECONDS", "3600"))
+
+class PDFQueueFull(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+# One generator per worker process, created by the pool initializer
+_worker_generator: Optional[PackagePDFGenerator] = None
+
+def _init_worker():
+    global _worker_generator
+    _worker_generator = PackagePDFGenerator()
+    # Fonts and stylesheets are reused by every render in this worker
+    warm_renderer()
+
+def _render_package(package_data: Dict[str, Any], client_info: Optional[Dict[str, Any]], layout: str, profile: str) -> Dict[str, Any]:
+    return _worker_generator.create_package_pdf(package_data, client_info, layout, profile)
+
+def _render_package_bytes(package_data: Dict[str, Any], client_info: Optional[Dict[str, Any]], layout: str, profile: str) -> bytes:
+    return _worker_generator.render_package_pdf(package_data, client_info, layout, profile)
+
+class PDFRenderPool:
+    def __init__(self, workers: int = PDF_WORKERS, queue_limit: int = PDF_QUEUE_LIMIT):
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        """Start the worker processes."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            logger.info(f"PDF render pool started with {self.workers} workers")
+
+    def shutdown(self, executor: Optional[ProcessPoolExecutor] = None):
+        """Stop the worker processes, dropping queued renders.
+
+        With an executor given, only stop it if it is still the current pool.
+        """
+        if self._executor is None or (executor is not None and executor is not self._executor):
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run a picklable function in the pool, rejecting work when the queue is full."""
+        if self.pending >= self.workers + self.queue_limit:
+            raise PDFQueueFull()
+
+        self.start()
+        executor = self._executor
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); replace the pool so later renders can proceed. Renders
+            # failing together all see this, so only the first may retire it, not a fresh replacement
+            if self._executor is executor:
+                logger.error("PDF render pool broken, restarting")
+            self.shutdown(executor)
+            raise
+        finally:
+            self.pending -= 1
+
+    async def render(
+        self,
+        package_data: Dict[str, Any],
+        client_info: Optional[Dict[str, Any]] = None,
+        layout: str = DEFAULT_LAYOUT,
+        profile: str = DEFAULT_PROFILE
+    ) -> Dict[str, Any]:
+        """Render a package brochure in a worker process."""
+        # Cache hits are answered here without queueing behind other renders
+        cached = cached_package_pdf(package_data, client_info, layout, profile)
+        if cached:
+            return cached
+        return await self.run(_render_package, package_data, client_info, layout, profile)
+
+    async def render_bytes(
+        self,
+        package_data: Dict[str, Any],
+        client_info: Optional[Dict[str, Any]] = None,
+        layout: str = DEFAULT_LAYOUT,
+        profile: str = DEFAULT_PROFILE
+    ) -> bytes:
+        """Render a package brochure in a worker process and return it in memory."""
+        return await self.run(_render_package_bytes, package_data, client_info, layout, profile)
+
+class PDFRetentionSweeper:
+    """Periodically trims uploads/pdfs by age and total size."""
+
+    def __init__(
+        self,
+        interval: float = PDF_RETENTION_SWEEP_SECONDS,
+        max_age_seconds: float = PDF_RETENTION_MAX_AGE_SECONDS,
+        max_bytes: int = PDF_CACHE_MAX_BYTES
+    ):
+        self.interval = interval
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def sweep(self) -> int:
+        """Run one sweep off the event loop and return the number of files removed."""
+        removed = await asyncio.to_thread(evict_pdf_cache, self.max_bytes, self.max_age_seconds)
+        if removed:
+            logger.info(f"PDF retention sweep removed {removed} files")
+        return removed
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"PDF retention sweep failed: {e}")
+            await asyncio.sleep(self.interval)
+
+# Global instances
+pdf_render_pool = PDFRenderPool()
+pdf_retention_sweeper = PDFRetentionSweeper()
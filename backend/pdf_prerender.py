@@ -0,0 +1,77 @@
+"""
+Brochure pre-rendering for G.M.B Travels Kashmir API
+Renders the generic brochure in the background after a package edit so the first download is a cache hit
+"""
+
+import os
+import asyncio
+import logging
+from typing import Any, Dict
+
+from database import get_database
+from pdf_generator import DEFAULT_LAYOUT
+from pdf_pool import pdf_render_pool, PDFQueueFull
+
+logger = logging.getLogger(__name__)
+
+PDF_PRERENDER_ENABLED = os.environ.get("PDF_PRERENDER", "false").lower() in ("1", "true", "yes")
+# Edits arriving within this window restart the wait, so only the last version is rendered
+PDF_PRERENDER_DELAY_SECONDS = float(os.environ.get("PDF_PRERENDER_DELAY_SECONDS", "5"))
+
+class BrochurePrerenderer:
+    def __init__(self, enabled: bool = PDF_PRERENDER_ENABLED, delay: float = PDF_PRERENDER_DELAY_SECONDS):
+        self.enabled = enabled
+        self.delay = delay
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    def schedule(self, package: Dict[str, Any]):
+        """Pre-render the generic brochure for this package version, superseding any pending render."""
+        if not self.enabled:
+            return
+        package_id = package["_id"]
+        self.cancel(package_id)
+        # Inactive packages are not browsed, so there is nothing to warm
+        if package.get("status", "active") != "active":
+            return
+        task = asyncio.create_task(self._render(package))
+        self._pending[package_id] = task
+        task.add_done_callback(lambda done: self._forget(package_id, done))
+
+    def cancel(self, package_id: str):
+        """Drop a pending pre-render.
+
+        Only the wait and the staleness check can be cancelled; a render
+        already handed to the process pool runs to completion.
+        """
+        task = self._pending.pop(package_id, None)
+        if task:
+            task.cancel()
+
+    def stop(self):
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+    def _forget(self, package_id: str, task: asyncio.Task):
+        if self._pending.get(package_id) is task:
+            del self._pending[package_id]
+
+    async def _render(self, package: Dict[str, Any]):
+        await asyncio.sleep(self.delay)
+        try:
+            # Another worker may have saved a newer version during the wait; leave that one to its own pre-render
+            current = await get_database().packages.find_one({"_id": package["_id"]}, {"updatedAt": 1, "status": 1})
+            if not current or current.get("updatedAt") != package.get("updatedAt") or current.get("status", "active") != "active":
+                logger.info(f"Skipped brochure pre-render for package {package['_id']}: superseded")
+                return
+            # Same inputs as a download without client info, so it lands on the same cache key
+            await pdf_render_pool.render(package, None, DEFAULT_LAYOUT)
+            logger.info(f"Pre-rendered brochure for package {package['_id']}")
+        except PDFQueueFull:
+            # Pre-rendering is opportunistic; never compete with interactive renders for queue slots
+            logger.info(f"Skipped brochure pre-render for package {package['_id']}: renderer busy")
+        except Exception as e:
+            logger.error(f"Brochure pre-render error for package {package['_id']}: {e}")
+
+# Global instance
+brochure_prerenderer = BrochurePrerenderer()
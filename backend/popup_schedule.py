@@ -0,0 +1,97 @@
+"""
+Popup activation schedule for G.M.B Travels Kashmir API
+Keeps the currently visible popups in memory and flips them on/off at their start and end times
+"""
+
+import os
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from models import Popup
+from database import get_database
+from http_cache import make_etag
+
+logger = logging.getLogger(__name__)
+
+# Periodic full reload so edits made through other workers are picked up (0 disables)
+POPUP_SCHEDULE_RESYNC_SECONDS = float(os.environ.get("POPUP_SCHEDULE_RESYNC_SECONDS", "300"))
+
+class PopupSchedule:
+    def __init__(self):
+        self.loaded = False
+        self.etag: Optional[str] = None
+        self._popups: List[Popup] = []
+        self._active: List[Popup] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._resync_task: Optional[asyncio.Task] = None
+
+    def active(self) -> List[Popup]:
+        """Currently visible popups, newest first."""
+        return self._active
+
+    async def start(self):
+        """Load the schedule and start the periodic resync."""
+        await self.rebuild()
+        if POPUP_SCHEDULE_RESYNC_SECONDS > 0 and self._resync_task is None:
+            self._resync_task = asyncio.create_task(self._resync_loop())
+
+    def stop(self):
+        """Cancel pending timers."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._resync_task:
+            self._resync_task.cancel()
+            self._resync_task = None
+
+    async def rebuild(self):
+        """Reload every enabled popup from MongoDB and recompute the active set."""
+        popup_cursor = get_database().popups.find({"isActive": True}).sort("createdAt", -1)
+        popups = await popup_cursor.to_list(length=1000)
+        self._popups = [Popup(**popup) for popup in popups]
+        self.loaded = True
+        self._refresh()
+
+    def _refresh(self):
+        """Recompute the active set for the current time and arm the next transition."""
+        now = datetime.utcnow()
+        self._active = [
+            popup for popup in self._popups
+            if popup.startDate <= now and (popup.endDate is None or popup.endDate >= now)
+        ]
+
+        # Tag from the full content so every worker derives the same ETag and any edit changes it
+        self.etag = make_etag("popups", [popup.dict() for popup in self._active])
+
+        self._arm_timer(now)
+
+    def _arm_timer(self, now: datetime):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        # Popups switch on at startDate and off just after endDate
+        transitions = [popup.startDate for popup in self._popups if popup.startDate > now]
+        transitions += [
+            popup.endDate + timedelta(milliseconds=1)
+            for popup in self._popups
+            if popup.endDate is not None and popup.endDate >= now
+        ]
+        if not transitions:
+            return
+
+        delay = (min(transitions) - now).total_seconds()
+        self._timer = asyncio.get_running_loop().call_later(max(delay, 0), self._refresh)
+
+    async def _resync_loop(self):
+        while True:
+            await asyncio.sleep(POPUP_SCHEDULE_RESYNC_SECONDS)
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logger.error(f"Popup schedule resync error: {e}")
+
+# Global instance
+popup_schedule = PopupSchedule()
@@ -0,0 +1,99 @@
+"""
+Refresh tokens for G.M.B Travels Kashmir API
+Long-lived opaque tokens, stored hashed and rotated on every use, that mint new short-lived access tokens
+"""
+
+import os
+import uuid
+import hashlib
+import secrets
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pymongo import ReturnDocument
+
+from database import get_database
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TOKEN_EXPIRE_DAYS = float(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+
+def _hash_token(token: str) -> str:
+    # Tokens are 256-bit random values, so a fast hash is enough to make a leaked collection useless
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+async def issue_refresh_token(kind: str, user_id: str, family: Optional[str] = None) -> str:
+    """Create a refresh token for an admin ("admin") or team member ("team").
+
+    Tokens rotated from the same login share a family, so reuse of an old
+    token can revoke the whole chain.
+    """
+    token = secrets.token_urlsafe(32)
+    now = datetime.utcnow()
+    await get_database().refresh_tokens.insert_one({
+        "_id": _hash_token(token),
+        "family": family or str(uuid.uuid4()),
+        "kind": kind,
+        "userId": user_id,
+        "usedAt": None,
+        "createdAt": now,
+        "expiresAt": now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    })
+    return token
+
+async def _load_user(kind: str, user_id: str) -> Optional[Dict[str, Any]]:
+    """Current access-token claims for the token's owner, or None if they can no longer log in."""
+    db = get_database()
+    if kind == "admin":
+        admin = await db.admins.find_one({"_id": user_id, "isActive": {"$ne": False}})
+        return admin and {"sub": admin["username"], "user_id": str(admin["_id"]), "role": "admin"}
+    team_member = await db.team_members.find_one({"_id": user_id, "isActive": True})
+    return team_member and {"sub": team_member["username"], "user_id": str(team_member["_id"]), "role": team_member["role"]}
+
+async def rotate_refresh_token(token: str) -> Tuple[Dict[str, Any], str]:
+    """Spend a refresh token and return (access token claims, replacement refresh token)."""
+    collection = get_database().refresh_tokens
+    now = datetime.utcnow()
+
+    # Mark as used atomically so two concurrent refreshes cannot both succeed
+    record = await collection.find_one_and_update(
+        {"_id": _hash_token(token), "usedAt": None, "expiresAt": {"$gt": now}},
+        {"$set": {"usedAt": now}},
+        return_document=ReturnDocument.AFTER
+    )
+    if not record:
+        spent = await collection.find_one({"_id": _hash_token(token), "usedAt": {"$ne": None}})
+        if spent:
+            # A rotated-out token came back: assume it was stolen and end the whole session
+            logger.warning(f"Refresh token reuse detected for {spent['kind']} {spent['userId']}")
+            await collection.delete_many({"family": spent["family"]})
+        raise _invalid_refresh_token()
+
+    claims = await _load_user(record["kind"], record["userId"])
+    if not claims:
+        await collection.delete_many({"family": record["family"]})
+        raise _invalid_refresh_token()
+
+    return claims, await issue_refresh_token(record["kind"], record["userId"], record["family"])
+
+async def revoke_user_refresh_tokens(kind: str, user_id: str):
+    """End every session of an admin or team member, e.g. after a password reset."""
+    result = await get_database().refresh_tokens.delete_many({"kind": kind, "userId": user_id})
+    if result.deleted_count:
+        logger.info(f"Revoked {result.deleted_count} refresh tokens for {kind} {user_id}")
+
+async def revoke_refresh_token(token: str):
+    """End the session a refresh token belongs to."""
+    collection = get_database().refresh_tokens
+    record = await collection.find_one({"_id": _hash_token(token)}, {"family": 1})
+    if record:
+        await collection.delete_many({"family": record["family"]})
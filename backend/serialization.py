@@ -0,0 +1,39 @@
+"""
+Fast JSON serialization for G.M.B Travels Kashmir API
+Encodes trusted MongoDB documents straight to JSON with orjson, skipping Pydantic re-validation
+"""
+
+from typing import Any, Optional
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from pydantic import BaseModel
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """Encode documents, models and datetimes to JSON bytes."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def fast_json(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """Return content as JSON, keeping headers already set on the injected response.
+
+    Documents written through our models are trusted, so reads skip both model
+    construction and FastAPI's response_model validation.
+    """
+    headers = None
+    if response is not None:
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return FastJSONResponse(content, headers=headers)
@@ -1,13 +1,15 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from contextlib import asynccontextmanager
 import os
+import gzip
+import asyncio
 from dotenv import load_dotenv
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 import shutil
 import uuid
 from datetime import datetime
@@ -18,8 +20,24 @@ load_dotenv()
 # Import models and database
 from models import *
 from database import connect_to_mongo, close_mongo_connection, get_database, create_default_admin
-from auth import AuthManager, admin_required, team_member_required
-from pdf_generator import PackagePDFGenerator
+from auth import AuthManager, admin_required, team_member_required, token_cache
+from pdf_pool import pdf_render_pool, pdf_retention_sweeper, PDFQueueFull
+from pdf_bulk import bulk_brochure_jobs, iter_zip
+from pdf_jobs import pdf_job_runner
+from pdf_prerender import brochure_prerenderer
+from pdf_generator import DEFAULT_LAYOUT, available_layouts, pdf_download_name
+from cache import catalog_cache, site_settings_store
+from popup_schedule import popup_schedule
+from pagination import PageParams, page_params, fetch_page, set_next_cursor, NEXT_CURSOR_HEADER
+from serialization import FastJSONResponse, dumps, fast_json
+from exports import EXPORT_DATASETS, EXPORT_BATCH_SIZE, ExportFormat, date_range_filter, stream_csv, stream_ndjson
+from http_cache import (
+    collection_fingerprint, make_etag, cache_headers, gzip_json_response,
+    is_not_modified, not_modified_response, set_cache_headers
+)
+from package_snapshots import write_snapshot, delete_snapshot, get_snapshot
+from login_throttle import login_throttle
+from refresh_tokens import issue_refresh_token, rotate_refresh_token, revoke_refresh_token, revoke_user_refresh_tokens
 
 # Configure logging
 logging.basicConfig(
@@ -34,8 +52,19 @@ async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
     await create_default_admin()
+    await load_site_settings()
+    await popup_schedule.start()
+    pdf_render_pool.start()
+    pdf_retention_sweeper.start()
+    await pdf_job_runner.start()
     yield
     # Shutdown
+    pdf_retention_sweeper.stop()
+    bulk_brochure_jobs.shutdown()
+    pdf_job_runner.stop()
+    brochure_prerenderer.stop()
+    popup_schedule.stop()
+    pdf_render_pool.shutdown()
     await close_mongo_connection()
 
 # Create FastAPI app
@@ -51,6 +80,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Create uploads directory
@@ -60,8 +90,13 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 # Mount static files for uploads
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
-# Initialize PDF generator
-pdf_generator = PackagePDFGenerator()
+# PDF rendering runs in a bounded process pool (PDF_WORKERS, PDF_QUEUE_LIMIT)
+PDF_BUSY_RETRY_AFTER = "10"
+# "disk" serves downloads from the uploads/pdfs cache, "memory" renders into a buffer and never persists
+PDF_DOWNLOAD_MODE = os.environ.get("PDF_DOWNLOAD_MODE", "disk").lower()
+
+# Site settings are memory-resident; reloading after this age picks up edits made by other workers (0 disables)
+SITE_SETTINGS_MAX_AGE_SECONDS = float(os.environ.get("SITE_SETTINGS_MAX_AGE_SECONDS", "300"))
 
 # Root endpoint
 @api_router.get("/")
@@ -70,20 +105,25 @@ async def root():
 
 # Authentication endpoints
 @api_router.post("/auth/login", response_model=TokenResponse)
-async def admin_login(login_data: AdminLogin):
+async def admin_login(login_data: AdminLogin, request: Request):
     """Admin login endpoint."""
     try:
         db = get_database()
         admin_collection = db.admins
         
+        # Attempts are counted, and over-limit ones rejected, before they cost a bcrypt verification
+        throttle_keys = login_throttle.keys("admin", login_data.username, request)
+        attempt = await login_throttle.register_attempt(throttle_keys)
+        
         # Find admin by username
         admin = await admin_collection.find_one({"username": login_data.username})
         
-        if not admin or not AuthManager.verify_password(login_data.password, admin["passwordHash"]):
+        if not admin or not await AuthManager.verify_password_async(login_data.password, admin["passwordHash"]):
             raise HTTPException(
                 status_code=401,
                 detail="Invalid username or password"
             )
+        await login_throttle.record_success(throttle_keys, attempt)
         
         # Update last login
         await admin_collection.update_one(
@@ -95,8 +135,9 @@ async def admin_login(login_data: AdminLogin):
         access_token = AuthManager.create_access_token(
             data={"sub": admin["username"], "user_id": str(admin["_id"]), "role": "admin"}
         )
+        refresh_token = await issue_refresh_token("admin", str(admin["_id"]))
         
-        return TokenResponse(access_token=access_token)
+        return TokenResponse(access_token=access_token, refresh_token=refresh_token)
         
     except HTTPException:
         raise
@@ -104,41 +145,102 @@ async def admin_login(login_data: AdminLogin):
         logger.error(f"Login error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@api_router.post("/auth/refresh", response_model=TokenResponse)
+async def refresh_access_token(refresh_data: RefreshTokenRequest):
+    """Exchange a refresh token for a new access token and a rotated refresh token."""
+    try:
+        claims, refresh_token = await rotate_refresh_token(refresh_data.refresh_token)
+        access_token = AuthManager.create_access_token(data=claims)
+        
+        return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Refresh token error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.post("/auth/logout")
+async def logout(refresh_data: RefreshTokenRequest):
+    """Revoke a refresh token and every token rotated from the same login."""
+    try:
+        await revoke_refresh_token(refresh_data.refresh_token)
+        return {"message": "Logged out successfully"}
+        
+    except Exception as e:
+        logger.error(f"Logout error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @api_router.get("/auth/verify")
 async def verify_token(current_admin: dict = Depends(admin_required)):
     """Verify admin token."""
     return {"valid": True, "admin": current_admin["sub"]}
 
+@api_router.get("/admin/auth/token-cache")
+async def get_token_cache_stats(current_admin: dict = Depends(admin_required)):
+    """Hit rate of the decoded-token cache (admin)."""
+    return token_cache.stats()
+
 # Package endpoints
-@api_router.get("/packages", response_model=List[Package])
-async def get_packages():
+ACTIVE_PACKAGES_KEY = ("status=active", "createdAt:-1", 100)
+
+async def load_active_packages(view: PackageView = PackageView.full) -> List[dict]:
+    """Active package documents from the catalog cache, reading through to MongoDB on a miss."""
+    cache_key = ACTIVE_PACKAGES_KEY + (view.value,)
+    packages = catalog_cache.get("packages", cache_key)
+    if packages is None:
+        # Capture the generation first so an invalidation during the read is not overwritten
+        generation = catalog_cache.generation("packages")
+        # Listing cards only need a handful of fields
+        projection = PACKAGE_SUMMARY_PROJECTION if view == PackageView.summary else None
+        packages_cursor = get_database().packages.find({"status": "active"}, projection).sort("createdAt", -1)
+        packages = await packages_cursor.to_list(length=100)
+        catalog_cache.set("packages", cache_key, packages, generation)
+    return packages
+
+@api_router.get("/packages", response_model=Union[List[Package], List[PackageSummary]])
+async def get_packages(
+    request: Request,
+    response: Response,
+    view: PackageView = Query(PackageView.full, description="'summary' returns listing-card fields only")
+):
     """Get all active packages (public)."""
     try:
         db = get_database()
         packages_collection = db.packages
         
-        packages_cursor = packages_collection.find({"status": "active"}).sort("createdAt", -1)
-        packages = await packages_cursor.to_list(length=100)
+        # Conditional GET
+        fingerprint = await collection_fingerprint(packages_collection, {"status": "active"})
+        etag = make_etag("packages", ACTIVE_PACKAGES_KEY, view.value, fingerprint)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
         
-        return [Package(**package) for package in packages]
+        return fast_json(await load_active_packages(view), response)
         
     except Exception as e:
         logger.error(f"Get packages error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch packages")
 
 @api_router.get("/packages/{package_id}", response_model=Package)
-async def get_package_by_id(package_id: str):
+async def get_package_by_id(package_id: str, request: Request):
     """Get package by ID (public)."""
     try:
-        db = get_database()
-        packages_collection = db.packages
-        
-        package = await packages_collection.find_one({"_id": package_id, "status": "active"})
+        # The detail body is materialized on write; fall back to building it once for older packages
+        snapshot = await get_snapshot(package_id)
+        if snapshot is None:
+            package = await get_database().packages.find_one({"_id": package_id, "status": "active"})
+            
+            if not package:
+                raise HTTPException(status_code=404, detail="Package not found")
+            
+            snapshot = await write_snapshot(package)
         
-        if not package:
-            raise HTTPException(status_code=404, detail="Package not found")
+        # Conditional GET
+        if is_not_modified(request, snapshot["etag"], snapshot["lastModified"]):
+            return not_modified_response(snapshot["etag"], snapshot["lastModified"])
         
-        return Package(**package)
+        return gzip_json_response(request, snapshot["body"], cache_headers(snapshot["etag"], snapshot["lastModified"]))
         
     except HTTPException:
         raise
@@ -148,17 +250,32 @@ async def get_package_by_id(package_id: str):
 
 # Admin package endpoints
 @api_router.get("/admin/packages", response_model=List[Package])
-async def admin_get_packages(current_admin: dict = Depends(admin_required)):
+async def admin_get_packages(
+    response: Response,
+    status: Optional[PackageStatus] = Query(None),
+    category: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_admin: dict = Depends(admin_required)
+):
     """Get all packages (admin)."""
     try:
         db = get_database()
         packages_collection = db.packages
         
-        packages_cursor = packages_collection.find({}).sort("createdAt", -1)
-        packages = await packages_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if status:
+            filters["status"] = status.value
+        if category:
+            filters["category"] = category
+        
+        packages, next_cursor = await fetch_page(packages_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
-        return [Package(**package) for package in packages]
+        return fast_json(packages, response)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Admin get packages error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch packages")
@@ -174,6 +291,11 @@ async def create_package(package_data: PackageCreate, current_admin: dict = Depe
         
         result = await packages_collection.insert_one(package.dict(by_alias=True))
         package.id = str(result.inserted_id)
+        catalog_cache.invalidate("packages")
+        catalog_cache.invalidate("bootstrap")
+        stored_package = await packages_collection.find_one({"_id": package.id})
+        await write_snapshot(stored_package)
+        brochure_prerenderer.schedule(stored_package)
         
         return package
         
@@ -201,9 +323,13 @@ async def update_package(package_id: str, package_data: PackageUpdate, current_a
             {"_id": package_id},
             {"$set": update_data}
         )
+        catalog_cache.invalidate("packages")
+        catalog_cache.invalidate("bootstrap")
         
         # Return updated package
         updated_package = await packages_collection.find_one({"_id": package_id})
+        await write_snapshot(updated_package)
+        brochure_prerenderer.schedule(updated_package)
         return Package(**updated_package)
         
     except HTTPException:
@@ -224,6 +350,11 @@ async def delete_package(package_id: str, current_admin: dict = Depends(admin_re
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Package not found")
         
+        catalog_cache.invalidate("packages")
+        catalog_cache.invalidate("bootstrap")
+        await delete_snapshot(package_id)
+        brochure_prerenderer.cancel(package_id)
+        
         return {"message": "Package deleted successfully"}
         
     except HTTPException:
@@ -252,33 +383,110 @@ async def create_booking(booking_data: BookingCreate):
         raise HTTPException(status_code=500, detail="Failed to create booking")
 
 @api_router.get("/admin/bookings", response_model=List[Booking])
-async def admin_get_bookings(current_admin: dict = Depends(admin_required)):
+async def admin_get_bookings(
+    response: Response,
+    status: Optional[BookingStatus] = Query(None),
+    bookingType: Optional[str] = Query(None),
+    email: Optional[str] = Query(None),
+    packageId: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_admin: dict = Depends(admin_required)
+):
     """Get all bookings (admin)."""
     try:
         db = get_database()
         bookings_collection = db.bookings
         
-        bookings_cursor = bookings_collection.find({}).sort("createdAt", -1)
-        bookings = await bookings_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if status:
+            filters["status"] = status.value
+        if bookingType:
+            filters["bookingType"] = bookingType
+        if email:
+            filters["email"] = email
+        if packageId:
+            filters["packageId"] = packageId
         
-        return [Booking(**booking) for booking in bookings]
+        bookings, next_cursor = await fetch_page(bookings_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
+        return fast_json(bookings, response)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Admin get bookings error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch bookings")
 
+# Export endpoints
+@api_router.get("/admin/export/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: ExportFormat = Query(ExportFormat.csv),
+    from_date: Optional[datetime] = Query(None, description="Include records created on or after this time"),
+    to_date: Optional[datetime] = Query(None, description="Include records created before this time"),
+    current_admin: dict = Depends(admin_required)
+):
+    """Stream bookings, cab bookings or inquiries as CSV or NDJSON (admin)."""
+    try:
+        export = EXPORT_DATASETS.get(dataset)
+        if not export:
+            raise HTTPException(status_code=404, detail="Unknown export dataset")
+        
+        db = get_database()
+        
+        # Rows are streamed batch by batch, so memory stays flat whatever the export size
+        cursor = db[export["collection"]].find(
+            date_range_filter(from_date, to_date)
+        ).sort("createdAt", 1).batch_size(EXPORT_BATCH_SIZE)
+        
+        if format == ExportFormat.ndjson:
+            body = stream_ndjson(cursor)
+            media_type = "application/x-ndjson"
+        else:
+            body = stream_csv(cursor, export["columns"])
+            media_type = "text/csv; charset=utf-8"
+        
+        filename = f"{dataset}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{format.value}"
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Export {dataset} error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to export data")
+
 # Testimonials endpoints
+async def load_approved_testimonials() -> List[dict]:
+    """Approved testimonial documents from the catalog cache, reading through to MongoDB on a miss."""
+    testimonials = catalog_cache.get("testimonials", "status=approved")
+    if testimonials is None:
+        generation = catalog_cache.generation("testimonials")
+        testimonials_cursor = get_database().testimonials.find({"status": "approved"}).sort("createdAt", -1)
+        testimonials = await testimonials_cursor.to_list(length=100)
+        catalog_cache.set("testimonials", "status=approved", testimonials, generation)
+    return testimonials
+
 @api_router.get("/testimonials", response_model=List[Testimonial])
-async def get_testimonials():
+async def get_testimonials(request: Request, response: Response):
     """Get approved testimonials (public)."""
     try:
         db = get_database()
         testimonials_collection = db.testimonials
         
-        testimonials_cursor = testimonials_collection.find({"status": "approved"}).sort("createdAt", -1)
-        testimonials = await testimonials_cursor.to_list(length=100)
+        # Conditional GET (testimonials are never edited, so createdAt is the version)
+        fingerprint = await collection_fingerprint(testimonials_collection, {"status": "approved"}, field="createdAt")
+        etag = make_etag("testimonials", fingerprint)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
         
-        return [Testimonial(**testimonial) for testimonial in testimonials]
+        return fast_json(await load_approved_testimonials(), response)
         
     except Exception as e:
         logger.error(f"Get testimonials error: {e}")
@@ -295,6 +503,8 @@ async def create_testimonial(testimonial_data: TestimonialCreate):
         
         result = await testimonials_collection.insert_one(testimonial.dict(by_alias=True))
         testimonial.id = str(result.inserted_id)
+        catalog_cache.invalidate("testimonials")
+        catalog_cache.invalidate("bootstrap")
         
         return testimonial
         
@@ -440,6 +650,8 @@ async def generate_package_pdf(
     client_phone: Optional[str] = Query(None),
     travel_date: Optional[str] = Query(None),
     travelers: Optional[int] = Query(None),
+    layout: str = Query(DEFAULT_LAYOUT, description="Brochure layout (a template in templates/)"),
+    profile: PDFProfile = Query(PDFProfile.print, description="Output size profile: print, screen or whatsapp"),
     current_admin: dict = Depends(admin_required)
 ):
     """Generate PDF for a specific package (admin)."""
@@ -447,6 +659,9 @@ async def generate_package_pdf(
         db = get_database()
         packages_collection = db.packages
         
+        if layout not in available_layouts():
+            raise HTTPException(status_code=400, detail="Unknown brochure layout")
+        
         # Get package data
         package = await packages_collection.find_one({"_id": package_id})
         if not package:
@@ -464,7 +679,7 @@ async def generate_package_pdf(
             }
         
         # Generate PDF
-        pdf_result = pdf_generator.create_package_pdf(package, client_info)
+        pdf_result = await pdf_render_pool.render(package, client_info, layout, profile.value)
         
         return {
             "success": True,
@@ -474,6 +689,12 @@ async def generate_package_pdf(
         
     except HTTPException:
         raise
+    except PDFQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, please retry shortly",
+            headers={"Retry-After": PDF_BUSY_RETRY_AFTER}
+        )
     except Exception as e:
         logger.error(f"Generate PDF error: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate PDF")
@@ -486,6 +707,8 @@ async def download_package_pdf(
     client_phone: Optional[str] = Query(None),
     travel_date: Optional[str] = Query(None),
     travelers: Optional[int] = Query(None),
+    layout: str = Query(DEFAULT_LAYOUT, description="Brochure layout (a template in templates/)"),
+    profile: PDFProfile = Query(PDFProfile.print, description="Output size profile: print, screen or whatsapp"),
     current_admin: dict = Depends(admin_required)
 ):
     """Download PDF for a specific package (admin)."""
@@ -493,6 +716,9 @@ async def download_package_pdf(
         db = get_database()
         packages_collection = db.packages
         
+        if layout not in available_layouts():
+            raise HTTPException(status_code=400, detail="Unknown brochure layout")
+        
         # Get package data
         package = await packages_collection.find_one({"_id": package_id})
         if not package:
@@ -509,8 +735,19 @@ async def download_package_pdf(
                 'travelers': travelers or 1
             }
         
+        if PDF_DOWNLOAD_MODE == "memory":
+            pdf_bytes = await pdf_render_pool.render_bytes(package, client_info, layout, profile.value)
+            return Response(
+                content=pdf_bytes,
+                media_type='application/pdf',
+                headers={
+                    "Content-Disposition": f'attachment; filename="{pdf_download_name(package)}"',
+                    "Cache-Control": "private, no-store"
+                }
+            )
+        
         # Generate PDF
-        pdf_result = pdf_generator.create_package_pdf(package, client_info)
+        pdf_result = await pdf_render_pool.render(package, client_info, layout, profile.value)
         
         # Return file for download
         return FileResponse(
@@ -521,6 +758,12 @@ async def download_package_pdf(
         
     except HTTPException:
         raise
+    except PDFQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, please retry shortly",
+            headers={"Retry-After": PDF_BUSY_RETRY_AFTER}
+        )
     except Exception as e:
         logger.error(f"Download PDF error: {e}")
         raise HTTPException(status_code=500, detail="Failed to download PDF")
@@ -531,7 +774,7 @@ async def generate_sample_pdf(current_admin: dict = Depends(admin_required)):
     try:
         from pdf_generator import generate_sample_pdf
         
-        pdf_result = generate_sample_pdf()
+        pdf_result = await pdf_render_pool.run(generate_sample_pdf)
         
         return {
             "success": True,
@@ -539,27 +782,139 @@ async def generate_sample_pdf(current_admin: dict = Depends(admin_required)):
             "pdf": pdf_result
         }
         
+    except PDFQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, please retry shortly",
+            headers={"Retry-After": PDF_BUSY_RETRY_AFTER}
+        )
     except Exception as e:
         logger.error(f"Generate sample PDF error: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate sample PDF")
 
-# Site Settings endpoints
-@api_router.get("/site-settings", response_model=SiteSettings)
-async def get_site_settings():
-    """Get site settings (public)."""
+@api_router.post("/admin/pdf-jobs", status_code=202)
+async def create_pdf_job(request: PDFJobCreate, current_admin: dict = Depends(admin_required)):
+    """Queue a brochure render and return its job id immediately (admin)."""
     try:
+        if request.layout not in available_layouts():
+            raise HTTPException(status_code=400, detail="Unknown brochure layout")
+        
         db = get_database()
-        settings_collection = db.site_settings
+        if not await db.packages.count_documents({"_id": request.package_id}, limit=1):
+            raise HTTPException(status_code=404, detail="Package not found")
+        
+        job = await pdf_job_runner.enqueue(PDFJob(
+            packageId=request.package_id,
+            clientInfo=request.client_info,
+            layout=request.layout,
+            profile=request.profile,
+            createdBy=current_admin.get("sub")
+        ))
+        return FastJSONResponse(job, status_code=202)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Create PDF job error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to queue PDF job")
+
+@api_router.get("/admin/pdf-jobs/{job_id}")
+async def get_pdf_job(job_id: str, current_admin: dict = Depends(admin_required)):
+    """Status and download URL of a queued brochure render (admin)."""
+    db = get_database()
+    job = await db.pdf_jobs.find_one({"_id": job_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    return fast_json(await pdf_job_runner.ensure_output(job))
+
+@api_router.post("/admin/pdf-bulk")
+async def start_bulk_brochures(request: BulkBrochureRequest, current_admin: dict = Depends(admin_required)):
+    """Render personalised brochures for many leads in the background (admin)."""
+    try:
+        if request.layout not in available_layouts():
+            raise HTTPException(status_code=400, detail="Unknown brochure layout")
+        
+        db = get_database()
+        package_ids = list({item.package_id for item in request.items})
+        packages = await db.packages.find({"_id": {"$in": package_ids}}).to_list(length=len(package_ids))
+        
+        job = bulk_brochure_jobs.start(
+            [item.dict() for item in request.items],
+            {package["_id"]: package for package in packages},
+            request.layout,
+            request.profile.value
+        )
+        return job.progress()
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Start bulk brochures error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to start bulk brochure job")
+
+@api_router.get("/admin/pdf-bulk/{job_id}")
+async def get_bulk_brochures(job_id: str, current_admin: dict = Depends(admin_required)):
+    """Progress of a bulk brochure job (admin)."""
+    job = bulk_brochure_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    return fast_json(job.progress())
+
+@api_router.get("/admin/pdf-bulk/{job_id}/download")
+async def download_bulk_brochures(job_id: str, current_admin: dict = Depends(admin_required)):
+    """Stream the brochures of a finished bulk job as one ZIP (admin)."""
+    job = bulk_brochure_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    if job.status == "running":
+        raise HTTPException(status_code=409, detail="Bulk job is still running")
+    if not job.entries:
+        raise HTTPException(status_code=404, detail="Bulk job produced no brochures")
+    
+    # The archive is assembled while it is sent, so nothing the size of the ZIP is held in memory
+    filename = f"brochures_{job.createdAt.strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        iter_zip(job.entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+# Site Settings endpoints
+async def load_site_settings() -> SiteSettings:
+    """Load active site settings into memory, creating defaults if none exist."""
+    async with site_settings_store.lock:
+        settings_collection = get_database().site_settings
         
         settings = await settings_collection.find_one({"isActive": True})
         
         if not settings:
-            # Create default settings if none exist
             default_settings = SiteSettings()
             await settings_collection.insert_one(default_settings.dict(by_alias=True))
-            return default_settings
+            site_settings_store.set(default_settings)
+        else:
+            site_settings_store.set(SiteSettings(**settings))
         
-        return SiteSettings(**settings)
+        return site_settings_store.value
+
+async def current_site_settings() -> SiteSettings:
+    """Memory-resident site settings; reloads if startup failed or the max age elapsed."""
+    if site_settings_store.is_stale(SITE_SETTINGS_MAX_AGE_SECONDS):
+        return await load_site_settings()
+    return site_settings_store.value
+
+@api_router.get("/site-settings", response_model=SiteSettings)
+async def get_site_settings(request: Request, response: Response):
+    """Get site settings (public)."""
+    try:
+        settings = await current_site_settings()
+        
+        # Conditional GET
+        etag = make_etag("site_settings", settings.id, settings.updatedAt)
+        if is_not_modified(request, etag, settings.updatedAt):
+            return not_modified_response(etag, settings.updatedAt)
+        set_cache_headers(response, etag, settings.updatedAt)
+        
+        return settings
         
     except Exception as e:
         logger.error(f"Get site settings error: {e}")
@@ -569,18 +924,8 @@ async def get_site_settings():
 async def admin_get_site_settings(current_admin: dict = Depends(admin_required)):
     """Get site settings (admin)."""
     try:
-        db = get_database()
-        settings_collection = db.site_settings
-        
-        settings = await settings_collection.find_one({"isActive": True})
-        
-        if not settings:
-            # Create default settings if none exist
-            default_settings = SiteSettings()
-            await settings_collection.insert_one(default_settings.dict(by_alias=True))
-            return default_settings
-        
-        return SiteSettings(**settings)
+        # Admin screens always read through to MongoDB
+        return await load_site_settings()
         
     except Exception as e:
         logger.error(f"Admin get site settings error: {e}")
@@ -593,26 +938,32 @@ async def update_site_settings(settings_data: SiteSettingsUpdate, current_admin:
         db = get_database()
         settings_collection = db.site_settings
         
-        # Find existing settings
-        existing_settings = await settings_collection.find_one({"isActive": True})
-        
-        if not existing_settings:
-            # Create new settings if none exist
-            new_settings = SiteSettings(**settings_data.dict(exclude_unset=True))
-            await settings_collection.insert_one(new_settings.dict(by_alias=True))
-            return new_settings
-        else:
-            # Update existing settings
-            update_data = settings_data.dict(exclude_unset=True)
-            
-            await settings_collection.update_one(
-                {"_id": existing_settings["_id"]},
-                {"$set": update_data}
-            )
+        async with site_settings_store.lock:
+            # Find existing settings
+            existing_settings = await settings_collection.find_one({"isActive": True})
             
-            # Return updated settings
-            updated_settings = await settings_collection.find_one({"_id": existing_settings["_id"]})
-            return SiteSettings(**updated_settings)
+            if not existing_settings:
+                # Create new settings if none exist
+                new_settings = SiteSettings(**settings_data.dict(exclude_unset=True))
+                await settings_collection.insert_one(new_settings.dict(by_alias=True))
+                site_settings_store.set(new_settings)
+                catalog_cache.invalidate("bootstrap")
+                return new_settings
+            else:
+                # Update existing settings
+                update_data = settings_data.dict(exclude_unset=True)
+                update_data["updatedAt"] = datetime.utcnow()
+                
+                await settings_collection.update_one(
+                    {"_id": existing_settings["_id"]},
+                    {"$set": update_data}
+                )
+                
+                # Return updated settings
+                updated_settings = await settings_collection.find_one({"_id": existing_settings["_id"]})
+                site_settings_store.set(SiteSettings(**updated_settings))
+                catalog_cache.invalidate("bootstrap")
+                return site_settings_store.value
         
     except Exception as e:
         logger.error(f"Update site settings error: {e}")
@@ -625,12 +976,15 @@ async def reset_site_settings(current_admin: dict = Depends(admin_required)):
         db = get_database()
         settings_collection = db.site_settings
         
-        # Delete existing settings
-        await settings_collection.delete_many({"isActive": True})
-        
-        # Create new default settings
-        default_settings = SiteSettings()
-        await settings_collection.insert_one(default_settings.dict(by_alias=True))
+        async with site_settings_store.lock:
+            # Delete existing settings
+            await settings_collection.delete_many({"isActive": True})
+            
+            # Create new default settings
+            default_settings = SiteSettings()
+            await settings_collection.insert_one(default_settings.dict(by_alias=True))
+            site_settings_store.set(default_settings)
+            catalog_cache.invalidate("bootstrap")
         
         return {"message": "Site settings reset to defaults", "settings": default_settings}
         
@@ -640,20 +994,25 @@ async def reset_site_settings(current_admin: dict = Depends(admin_required)):
 
 # Team Management endpoints
 @api_router.post("/team/login", response_model=TokenResponse)
-async def team_login(login_data: TeamLogin):
+async def team_login(login_data: TeamLogin, request: Request):
     """Team member login endpoint."""
     try:
         db = get_database()
         team_collection = db.team_members
         
+        # Attempts are counted, and over-limit ones rejected, before they cost a bcrypt verification
+        throttle_keys = login_throttle.keys("team", login_data.username, request)
+        attempt = await login_throttle.register_attempt(throttle_keys)
+        
         # Find team member by username
         team_member = await team_collection.find_one({"username": login_data.username, "isActive": True})
         
-        if not team_member or not AuthManager.verify_password(login_data.password, team_member["passwordHash"]):
+        if not team_member or not await AuthManager.verify_password_async(login_data.password, team_member["passwordHash"]):
             raise HTTPException(
                 status_code=401,
                 detail="Invalid username or password"
             )
+        await login_throttle.record_success(throttle_keys, attempt)
         
         # Update last login
         await team_collection.update_one(
@@ -665,8 +1024,9 @@ async def team_login(login_data: TeamLogin):
         access_token = AuthManager.create_access_token(
             data={"sub": team_member["username"], "user_id": str(team_member["_id"]), "role": team_member["role"]}
         )
+        refresh_token = await issue_refresh_token("team", str(team_member["_id"]))
         
-        return TokenResponse(access_token=access_token)
+        return TokenResponse(access_token=access_token, refresh_token=refresh_token)
         
     except HTTPException:
         raise
@@ -675,17 +1035,35 @@ async def team_login(login_data: TeamLogin):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @api_router.get("/admin/team", response_model=List[TeamMember])
-async def get_team_members(current_admin: dict = Depends(admin_required)):
+async def get_team_members(
+    response: Response,
+    role: Optional[UserRole] = Query(None),
+    department: Optional[str] = Query(None),
+    isActive: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_admin: dict = Depends(admin_required)
+):
     """Get all team members (admin)."""
     try:
         db = get_database()
         team_collection = db.team_members
         
-        team_cursor = team_collection.find({}).sort("createdAt", -1)
-        team_members = await team_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if role:
+            filters["role"] = role.value
+        if department:
+            filters["department"] = department
+        if isActive is not None:
+            filters["isActive"] = isActive
+        
+        team_members, next_cursor = await fetch_page(team_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
         return [TeamMember(**member) for member in team_members]
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get team members error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch team members")
@@ -708,7 +1086,7 @@ async def create_team_member(team_data: TeamMemberCreate, current_admin: dict =
         # Create team member with hashed password
         team_member = TeamMember(
             **team_data.dict(exclude={'password'}),
-            passwordHash=AuthManager.get_password_hash(team_data.password)
+            passwordHash=await AuthManager.get_password_hash_async(team_data.password)
         )
         
         result = await team_collection.insert_one(team_member.dict(by_alias=True))
@@ -741,6 +1119,8 @@ async def update_team_member(member_id: str, team_data: TeamMemberUpdate, curren
             {"_id": member_id},
             {"$set": update_data}
         )
+        if update_data.get("isActive") is False:
+            await revoke_user_refresh_tokens("team", member_id)
         
         # Return updated member
         updated_member = await team_collection.find_one({"_id": member_id})
@@ -763,6 +1143,7 @@ async def delete_team_member(member_id: str, current_admin: dict = Depends(admin
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Team member not found")
+        await revoke_user_refresh_tokens("team", member_id)
         
         return {"message": "Team member deleted successfully"}
         
@@ -789,12 +1170,14 @@ async def admin_change_team_password(
             raise HTTPException(status_code=404, detail="Team member not found")
         
         # Hash new password and update
-        new_password_hash = AuthManager.get_password_hash(new_password)
+        new_password_hash = await AuthManager.get_password_hash_async(new_password)
         
         await team_collection.update_one(
             {"_id": member_id},
             {"$set": {"passwordHash": new_password_hash, "updatedAt": datetime.utcnow()}}
         )
+        # Sessions started with the old password must not outlive it
+        await revoke_user_refresh_tokens("team", member_id)
         
         return {"message": "Password updated successfully"}
         
@@ -805,43 +1188,57 @@ async def admin_change_team_password(
         raise HTTPException(status_code=500, detail="Failed to change password")
 
 # Popup/Announcement endpoints
+async def current_popups() -> List[Popup]:
+    """Active popups from the in-memory schedule; nothing to query per request."""
+    if not popup_schedule.loaded:
+        await popup_schedule.start()
+    return popup_schedule.active()
+
 @api_router.get("/popups", response_model=List[Popup])
-async def get_active_popups():
+async def get_active_popups(request: Request, response: Response):
     """Get active popups (public)."""
     try:
-        db = get_database()
-        popup_collection = db.popups
+        popups = await current_popups()
         
-        # Get active popups that haven't expired
-        current_time = datetime.utcnow()
-        popup_cursor = popup_collection.find({
-            "isActive": True,
-            "startDate": {"$lte": current_time},
-            "$or": [
-                {"endDate": None},
-                {"endDate": {"$gte": current_time}}
-            ]
-        }).sort("createdAt", -1)
+        # Conditional GET
+        etag = popup_schedule.etag
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
         
-        popups = await popup_cursor.to_list(length=100)
-        return [Popup(**popup) for popup in popups]
+        return fast_json(popups, response)
         
     except Exception as e:
         logger.error(f"Get popups error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch popups")
 
 @api_router.get("/admin/popups", response_model=List[Popup])
-async def admin_get_popups(current_admin: dict = Depends(admin_required)):
+async def admin_get_popups(
+    response: Response,
+    popupType: Optional[PopupType] = Query(None),
+    isActive: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_admin: dict = Depends(admin_required)
+):
     """Get all popups (admin)."""
     try:
         db = get_database()
         popup_collection = db.popups
         
-        popup_cursor = popup_collection.find({}).sort("createdAt", -1)
-        popups = await popup_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if popupType:
+            filters["popupType"] = popupType.value
+        if isActive is not None:
+            filters["isActive"] = isActive
+        
+        popups, next_cursor = await fetch_page(popup_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
-        return [Popup(**popup) for popup in popups]
+        return fast_json(popups, response)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Admin get popups error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch popups")
@@ -857,6 +1254,8 @@ async def create_popup(popup_data: PopupCreate, current_admin: dict = Depends(ad
         
         result = await popup_collection.insert_one(popup.dict(by_alias=True))
         popup.id = str(result.inserted_id)
+        await popup_schedule.rebuild()
+        catalog_cache.invalidate("bootstrap")
         
         return popup
         
@@ -876,13 +1275,16 @@ async def update_popup(popup_id: str, popup_data: PopupUpdate, current_admin: di
         if not existing_popup:
             raise HTTPException(status_code=404, detail="Popup not found")
         
-        # Update popup
+        # Update popup (updatedAt is set here so the public ETag always moves on edit)
         update_data = {k: v for k, v in popup_data.dict().items() if v is not None}
+        update_data["updatedAt"] = datetime.utcnow()
         
         await popup_collection.update_one(
             {"_id": popup_id},
             {"$set": update_data}
         )
+        await popup_schedule.rebuild()
+        catalog_cache.invalidate("bootstrap")
         
         # Return updated popup
         updated_popup = await popup_collection.find_one({"_id": popup_id})
@@ -906,6 +1308,9 @@ async def delete_popup(popup_id: str, current_admin: dict = Depends(admin_requir
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Popup not found")
         
+        await popup_schedule.rebuild()
+        catalog_cache.invalidate("bootstrap")
+        
         return {"message": "Popup deleted successfully"}
         
     except HTTPException:
@@ -916,17 +1321,35 @@ async def delete_popup(popup_id: str, current_admin: dict = Depends(admin_requir
 
 # Enhanced CRM endpoints
 @api_router.get("/admin/clients", response_model=List[Client])
-async def get_clients(current_user: dict = Depends(team_member_required)):
+async def get_clients(
+    response: Response,
+    status: Optional[ClientStatus] = Query(None),
+    source: Optional[str] = Query(None),
+    assignedTo: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_user: dict = Depends(team_member_required)
+):
     """Get all clients (team members)."""
     try:
         db = get_database()
         client_collection = db.clients
         
-        client_cursor = client_collection.find({}).sort("createdAt", -1)
-        clients = await client_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if status:
+            filters["status"] = status.value
+        if source:
+            filters["source"] = source
+        if assignedTo:
+            filters["assignedTo"] = assignedTo
         
-        return [Client(**client) for client in clients]
+        clients, next_cursor = await fetch_page(client_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
+        return fast_json(clients, response)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get clients error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch clients")
@@ -1132,6 +1555,8 @@ async def add_client_review(
 # Blog Management endpoints
 @api_router.get("/blog/posts", response_model=List[BlogPost])
 async def get_published_blog_posts(
+    request: Request,
+    response: Response,
     category: Optional[str] = None,
     tag: Optional[str] = None,
     limit: int = Query(default=20, le=100)
@@ -1148,10 +1573,17 @@ async def get_published_blog_posts(
         if tag:
             query["tags"] = {"$in": [tag]}
         
+        # Conditional GET
+        fingerprint = await collection_fingerprint(blog_collection, query)
+        etag = make_etag("blog_posts", category, tag, limit, fingerprint)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
+        
         blog_cursor = blog_collection.find(query).sort("publishedAt", -1).limit(limit)
         blogs = await blog_cursor.to_list(length=limit)
         
-        return [BlogPost(**blog) for blog in blogs]
+        return fast_json(blogs, response)
         
     except Exception as e:
         logger.error(f"Get blog posts error: {e}")
@@ -1184,17 +1616,35 @@ async def get_blog_post_by_slug(slug: str):
         raise HTTPException(status_code=500, detail="Failed to fetch blog post")
 
 @api_router.get("/admin/blog/posts", response_model=List[BlogPost])
-async def admin_get_blog_posts(current_user: dict = Depends(team_member_required)):
+async def admin_get_blog_posts(
+    response: Response,
+    status: Optional[BlogStatus] = Query(None),
+    category: Optional[BlogCategory] = Query(None),
+    authorId: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params),
+    current_user: dict = Depends(team_member_required)
+):
     """Get all blog posts (team members)."""
     try:
         db = get_database()
         blog_collection = db.blog_posts
         
-        blog_cursor = blog_collection.find({}).sort("createdAt", -1)
-        blogs = await blog_cursor.to_list(length=1000)
+        # Server-side filters
+        filters = {}
+        if status:
+            filters["status"] = status.value
+        if category:
+            filters["category"] = category.value
+        if authorId:
+            filters["authorId"] = authorId
+        
+        blogs, next_cursor = await fetch_page(blog_collection, filters, page)
+        set_next_cursor(response, next_cursor)
         
-        return [BlogPost(**blog) for blog in blogs]
+        return fast_json(blogs, response)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Admin get blog posts error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blog posts")
@@ -1221,6 +1671,7 @@ async def create_blog_post(blog_data: BlogPostCreate, current_user: dict = Depen
         
         result = await blog_collection.insert_one(blog.dict(by_alias=True))
         blog.id = str(result.inserted_id)
+        catalog_cache.invalidate("blog_posts")
         
         return blog
         
@@ -1242,8 +1693,9 @@ async def update_blog_post(post_id: str, blog_data: BlogPostUpdate, current_user
         if not existing_blog:
             raise HTTPException(status_code=404, detail="Blog post not found")
         
-        # Handle status changes
+        # Handle status changes (updatedAt is set here so the public ETag always moves on edit)
         update_data = {k: v for k, v in blog_data.dict().items() if v is not None}
+        update_data["updatedAt"] = datetime.utcnow()
         
         if "status" in update_data:
             if update_data["status"] == "published" and not existing_blog.get("publishedAt"):
@@ -1255,6 +1707,7 @@ async def update_blog_post(post_id: str, blog_data: BlogPostUpdate, current_user
             {"_id": post_id},
             {"$set": update_data}
         )
+        catalog_cache.invalidate("blog_posts")
         
         # Return updated blog
         updated_blog = await blog_collection.find_one({"_id": post_id})
@@ -1278,6 +1731,8 @@ async def delete_blog_post(post_id: str, current_user: dict = Depends(admin_requ
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Blog post not found")
         
+        catalog_cache.invalidate("blog_posts")
+        
         return {"message": "Blog post deleted successfully"}
         
     except HTTPException:
@@ -1325,6 +1780,7 @@ async def generate_ai_blog_post(request_data: AIBlogRequest, current_user: dict
         
         result = await blog_collection.insert_one(blog.dict(by_alias=True))
         blog.id = str(result.inserted_id)
+        catalog_cache.invalidate("blog_posts")
         
         return blog
         
@@ -1422,8 +1878,25 @@ async def test_ai_connection(current_admin: dict = Depends(admin_required)):
 # VEHICLE MANAGEMENT ENDPOINTS
 # ============================================================================
 
+async def load_vehicles(active_only: bool = True) -> List[dict]:
+    """Vehicles from the catalog cache, reading through to MongoDB on a miss."""
+    vehicles = catalog_cache.get("vehicles", ("active_only", active_only))
+    if vehicles is None:
+        generation = catalog_cache.generation("vehicles")
+        filter_criteria = {"isActive": True} if active_only else {}
+        vehicles = await get_database().vehicles.find(filter_criteria).sort("sortOrder", 1).to_list(length=100)
+        
+        # Convert ObjectId to string for each vehicle
+        for vehicle in vehicles:
+            vehicle["_id"] = str(vehicle["_id"])
+        
+        catalog_cache.set("vehicles", ("active_only", active_only), vehicles, generation)
+    return vehicles
+
 @api_router.get("/vehicles", tags=["vehicles"])
 async def get_vehicles(
+    request: Request,
+    response: Response,
     active_only: bool = Query(True, description="Return only active vehicles")
 ):
     """Get all vehicles (public endpoint)."""
@@ -1433,14 +1906,14 @@ async def get_vehicles(
         if active_only:
             filter_criteria["isActive"] = True
         
-        vehicles_cursor = db.vehicles.find(filter_criteria)
-        vehicles = await vehicles_cursor.sort("sortOrder", 1).to_list(length=100)
+        # Conditional GET
+        fingerprint = await collection_fingerprint(db.vehicles, filter_criteria)
+        etag = make_etag("vehicles", active_only, fingerprint)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
         
-        # Convert ObjectId to string for each vehicle
-        for vehicle in vehicles:
-            vehicle["_id"] = str(vehicle["_id"])
-        
-        return {"status": "success", "data": vehicles}
+        return {"status": "success", "data": await load_vehicles(active_only)}
         
     except Exception as e:
         logger.error(f"Get vehicles error: {e}")
@@ -1480,6 +1953,8 @@ async def create_vehicle(
         vehicle_dict = vehicle.dict(by_alias=True)
         
         result = await db.vehicles.insert_one(vehicle_dict)
+        catalog_cache.invalidate("vehicles")
+        catalog_cache.invalidate("bootstrap")
         
         # Get the created vehicle
         created_vehicle = await db.vehicles.find_one({"_id": vehicle.id})
@@ -1515,6 +1990,9 @@ async def update_vehicle(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Vehicle not found")
         
+        catalog_cache.invalidate("vehicles")
+        catalog_cache.invalidate("bootstrap")
+        
         # Get the updated vehicle
         updated_vehicle = await db.vehicles.find_one({"_id": vehicle_id})
         updated_vehicle["_id"] = str(updated_vehicle["_id"])
@@ -1542,6 +2020,9 @@ async def delete_vehicle(
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Vehicle not found")
         
+        catalog_cache.invalidate("vehicles")
+        catalog_cache.invalidate("bootstrap")
+        
         return {
             "status": "success",
             "message": "Vehicle deleted successfully"
@@ -1551,6 +2032,58 @@ async def delete_vehicle(
         logger.error(f"Delete vehicle error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================================================
+# HOMEPAGE BOOTSTRAP ENDPOINT
+# ============================================================================
+
+@api_router.get("/bootstrap", tags=["bootstrap"])
+async def get_bootstrap(request: Request):
+    """Get packages, vehicles, testimonials, site settings and popups in one response (public)."""
+    try:
+        db = get_database()
+        generation = catalog_cache.generation("bootstrap")
+        
+        # Fan out the five homepage reads (and their validators) concurrently
+        (
+            packages, vehicles, testimonials, settings, popups,
+            packages_fingerprint, vehicles_fingerprint, testimonials_fingerprint
+        ) = await asyncio.gather(
+            load_active_packages(PackageView.summary),
+            load_vehicles(active_only=True),
+            load_approved_testimonials(),
+            current_site_settings(),
+            current_popups(),
+            collection_fingerprint(db.packages, {"status": "active"}),
+            collection_fingerprint(db.vehicles, {"isActive": True}),
+            collection_fingerprint(db.testimonials, {"status": "approved"}, field="createdAt")
+        )
+        
+        # Combined version key over every section
+        etag = make_etag(
+            "bootstrap", packages_fingerprint, vehicles_fingerprint, testimonials_fingerprint,
+            settings.id, settings.updatedAt, popup_schedule.etag
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        
+        # The gzipped payload is cached as one unit under the combined version; every write to a section drops it
+        payload = catalog_cache.get("bootstrap", etag)
+        if payload is None:
+            payload = gzip.compress(dumps({
+                "packages": packages,
+                "vehicles": vehicles,
+                "testimonials": testimonials,
+                "siteSettings": settings,
+                "popups": popups
+            }))
+            catalog_cache.set("bootstrap", etag, payload, generation)
+        
+        return gzip_json_response(request, payload, cache_headers(etag))
+        
+    except Exception as e:
+        logger.error(f"Get bootstrap error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch homepage data")
+
 # ============================================================================
 # WHATSAPP CRM INTEGRATION ENDPOINTS
 # ============================================================================